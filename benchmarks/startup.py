@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Commands timed from a fresh interpreter, by name
+COMMANDS = {
+    'python': ['-c', 'pass'],
+    'import main': ['-c', 'import main'],
+    'main.py --help': [os.path.join(ROOT, 'main.py'), '--help'],
+    'import life': ['-c', 'import life'],
+}
+
+
+def time_command(args, runs) -> float:
+    """Return the median wall time in milliseconds of running python with args."""
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time cold start of the CLI.')
+    parser.add_argument('--runs', type=int, default=11, help='runs per command (default 11)')
+    parser.add_argument('--target-ms', type=float, default=50,
+                        help='max median time of "main.py --help" above bare python startup '
+                             '(default 50)')
+    args = parser.parse_args()
+
+    results = {}
+    for name, command in COMMANDS.items():
+        results[name] = time_command(command, args.runs)
+        print('{:<16}{:>8.1f} ms'.format(name, results[name]))
+
+    overhead = results['main.py --help'] - results['python']
+    print('\nCLI startup overhead: {:.1f} ms (target {:.1f} ms)'.format(overhead, args.target_ms))
+
+    # Non-zero exit so scripted runs notice a regression
+    if overhead > args.target_ms:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import engines
+from life import Board
+
+
+def time_engine(board: Board, engine, ticks) -> float:
+    """Return the mean seconds per tick of advancing board with the named engine."""
+
+    board.engine = engine
+    start = time.perf_counter()
+    for _ in range(ticks):
+        board.step()
+
+    return (time.perf_counter() - start) / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare stepping engines on random soups.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[32, 64, 128],
+                        help='side lengths of the square boards to time (default 32 64 128)')
+    parser.add_argument('--ticks', type=int, default=5, help='ticks per board (default 5)')
+    parser.add_argument('--density', type=float, default=35,
+                        help='percent of living cells in the soups (default 35)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default 0)')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    # Table set-up cost, from scratch and from the disk cache
+    start = time.perf_counter()
+    engines.build_block_table()
+    print('Build 4x4 table:      {:8.1f} ms'.format((time.perf_counter() - start) * 1000))
+    engines.block_table()
+    engines._block_table = None
+    start = time.perf_counter()
+    engines.block_table()
+    print('Load 4x4 table:       {:8.1f} ms\n'.format((time.perf_counter() - start) * 1000))
+
+    print('{:>6}  {:>12}  {:>12}  {:>8}'.format('size', 'scalar ms', 'lut ms', 'speedup'))
+    for size in args.sizes:
+        scalar = Board(0, size, size, Board.get_random_board(size, size, args.density))
+        lut = scalar.clone()
+
+        scalar_time = time_engine(scalar, 'scalar', args.ticks)
+        lut_time = time_engine(lut, 'lut', args.ticks)
+
+        if scalar.state != lut.state:
+            print('Engines disagree on the {0}x{0} board!'.format(size))
+            sys.exit(1)
+
+        print('{:>6}  {:>12.2f}  {:>12.2f}  {:>7.1f}x'.format(
+            size, scalar_time * 1000, lut_time * 1000, scalar_time / lut_time))
+
+
+if __name__ == '__main__':
+    main()
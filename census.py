@@ -0,0 +1,212 @@
+import re
+from collections import Counter
+from typing import List, Tuple
+
+from patterns import step_cells, normalize
+
+
+# Small objects recognized by census(), by name: (kind, one phase as rows of 'O' and '.')
+SEED_OBJECTS = {
+    'block': ('still life', ['OO', 'OO']),
+    'beehive': ('still life', ['.OO.', 'O..O', '.OO.']),
+    'loaf': ('still life', ['.OO.', 'O..O', '.O.O', '..O.']),
+    'boat': ('still life', ['OO.', 'O.O', '.O.']),
+    'ship': ('still life', ['OO.', 'O.O', '.OO']),
+    'tub': ('still life', ['.O.', 'O.O', '.O.']),
+    'pond': ('still life', ['.OO.', 'O..O', 'O..O', '.OO.']),
+    'barge': ('still life', ['.O..', 'O.O.', '.O.O', '..O.']),
+    'long boat': ('still life', ['OO..', 'O.O.', '.O.O', '..O.']),
+    'snake': ('still life', ['OO.O', 'O.OO']),
+    'aircraft carrier': ('still life', ['OO..', 'O..O', '..OO']),
+    'mango': ('still life', ['.OO..', 'O..O.', '.O..O', '..OO.']),
+    'blinker': ('oscillator', ['OOO']),
+    'toad': ('oscillator', ['.OOO', 'OOO.']),
+    'beacon': ('oscillator', ['OO..', 'OO..', '..OO', '..OO']),
+    'clock': ('oscillator', ['..O.', 'O.O.', '.O.O', '.O..']),
+    'glider': ('spaceship', ['.O.', '..O', 'OOO']),
+    'lightweight spaceship': ('spaceship', ['.O..O', 'O....', 'O...O', 'OOOO.']),
+    'middleweight spaceship': ('spaceship', ['...O..', '.O...O', 'O.....', 'O....O', 'OOOOO.']),
+    'heavyweight spaceship': ('spaceship', ['...OO..', '.O....O', 'O......', 'O.....O',
+                                            'OOOOOO.']),
+}
+
+# Most generations stepped to find all phases of a seed object
+MAX_PHASES = 8
+
+_known = None
+
+
+def canonical(cells) -> Tuple[Tuple[int, int], ...]:
+    """Return the smallest normalized form of cells under the 8 rotations and reflections."""
+
+    forms = []
+    for transform in ((1, 0, 0, 1), (0, -1, 1, 0), (-1, 0, 0, -1), (0, 1, -1, 0),
+                      (-1, 0, 0, 1), (1, 0, 0, -1), (0, 1, 1, 0), (0, -1, -1, 0)):
+        a, b, c, d = transform
+        forms.append(normalize([(a * x + b * y, c * x + d * y) for x, y in cells])[0])
+
+    return min(forms)
+
+
+def known_objects(library=None) -> dict:
+    """Return the lookup table from canonical cells to (name, kind).
+
+    Every phase of each object in SEED_OBJECTS is included. If library (a
+    patterns.PatternLibrary) is given, its still lifes, oscillators and
+    spaceships are added as well.
+
+    """
+
+    global _known
+
+    if _known is None:
+        _known = {}
+        for name, (kind, rows) in SEED_OBJECTS.items():
+            cells = {(x, y) for y, line in enumerate(rows) for x, char in enumerate(line)
+                     if char == 'O'}
+            _add_phases(_known, name, kind, cells)
+
+    if library is None:
+        return _known
+
+    table = dict(_known)
+    for entry in library.entries:
+        if entry.period is None or entry.period > MAX_PHASES * 4 or entry.population > 200:
+            continue
+        kind = 'still life' if entry.period == 1 else \
+            'spaceship' if tuple(entry.displacement) != (0, 0) else 'oscillator'
+        _add_phases(table, entry.name, kind, set(library.cells(entry.name)), entry.period)
+
+    return table
+
+
+def _add_phases(table, name, kind, cells, period=MAX_PHASES):
+    """Add the canonical form of every phase of cells to table, keeping existing names."""
+
+    for _ in range(period):
+        table.setdefault(canonical(cells), (name, kind))
+        cells = step_cells(cells)
+
+
+def _runs(row_bits: str) -> List[Tuple[int, int]]:
+    """Return (start, end) columns, inclusive, of each run of living cells in a row."""
+
+    return [(m.start(), m.end() - 1) for m in re.finditer('1+', row_bits)]
+
+
+def label_clusters(board) -> List[List[Tuple[int, int]]]:
+    """Return the 8-connected clusters of living cells as lists of (row, col).
+
+    Cells are labeled a run at a time rather than a cell at a time: each row
+    is split into runs of living cells, runs of adjacent rows that touch
+    (diagonally included, wrapping around the toroidal board) are merged with
+    a union-find, and the cells are only listed once clusters are known.
+
+    """
+
+    height, width = board.height, board.width
+    runs = [_runs(row.bin) for row in board.state]
+
+    # Union-find over (row, run index) ids
+    ids = {}
+    parent = []
+    for row, row_runs in enumerate(runs):
+        for i in range(len(row_runs)):
+            ids[(row, i)] = len(parent)
+            parent.append(len(parent))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(a, b):
+        a, b = find(a), find(b)
+        if a != b:
+            parent[b] = a
+
+    for row, row_runs in enumerate(runs):
+        if not row_runs:
+            continue
+
+        # Runs at both ends of a row touch through the wrap
+        if len(row_runs) > 1 and row_runs[0][0] == 0 and row_runs[-1][1] == width - 1:
+            union(ids[(row, 0)], ids[(row, len(row_runs) - 1)])
+
+        if height == 1 or (height == 2 and row == 1):
+            continue
+        next_row = (row + 1) % height
+        next_runs = runs[next_row]
+
+        # Runs whose columns, widened by one, overlap; both lists are sorted
+        i = j = 0
+        while i < len(row_runs) and j < len(next_runs):
+            start, end = row_runs[i]
+            next_start, next_end = next_runs[j]
+            if start - 1 <= next_end and next_start <= end + 1:
+                union(ids[(row, i)], ids[(next_row, j)])
+            if end < next_end:
+                i += 1
+            else:
+                j += 1
+
+        # Diagonal neighbors across the left/right edge
+        if next_runs:
+            if row_runs[-1][1] == width - 1 and next_runs[0][0] == 0:
+                union(ids[(row, len(row_runs) - 1)], ids[(next_row, 0)])
+            if row_runs[0][0] == 0 and next_runs[-1][1] == width - 1:
+                union(ids[(row, 0)], ids[(next_row, len(next_runs) - 1)])
+
+    clusters = {}
+    for (row, i), run_id in ids.items():
+        start, end = runs[row][i]
+        clusters.setdefault(find(run_id), []).extend((row, col) for col in range(start, end + 1))
+
+    return list(clusters.values())
+
+
+def unwrap(values, size) -> dict:
+    """Return a mapping of coordinates that moves a wrapped-around cluster into one piece.
+
+    If values cover both ends of the board, they are shifted so the board
+    edge falls in an empty line of the cluster instead.
+
+    """
+
+    present = set(values)
+    if 0 not in present or size - 1 not in present or len(present) == size:
+        return {value: value for value in present}
+
+    gap = next(value for value in range(size) if value not in present)
+    return {value: (value - gap - 1) % size for value in present}
+
+
+def find_objects(board, library=None) -> List[Tuple[str, str, List[Tuple[int, int]]]]:
+    """Return (name, kind, cells) of every cluster of living cells on the board.
+
+    Clusters that match no known object are named "unknown (N cells)" with
+    kind 'unknown'. Cells are (row, col) tuples.
+
+    """
+
+    table = known_objects(library)
+
+    objects = []
+    for cells in label_clusters(board):
+        rows = unwrap([row for row, _ in cells], board.height)
+        cols = unwrap([col for _, col in cells], board.width)
+
+        # Skip shapes too big to be known objects without canonicalizing them
+        key = canonical([(cols[col], rows[row]) for row, col in cells]) if len(cells) <= 64 \
+            else None
+        name, kind = table.get(key, ('unknown ({} cells)'.format(len(cells)), 'unknown'))
+        objects.append((name, kind, cells))
+
+    return objects
+
+
+def census(board, library=None) -> Counter:
+    """Return a Counter of the names of the objects on the board."""
+
+    return Counter(name for name, _, _ in find_objects(board, library))
@@ -0,0 +1,280 @@
+import sys
+import time
+import random
+import shutil
+import hashlib
+import argparse
+import tempfile
+
+import engines
+import patterns
+from life import Board
+from escape import EscapeDetector
+from mmapboard import MappedBoard
+
+
+# Stepping paths checked besides the engines in engines.ENGINES
+EXTRA_CANDIDATES = ['incremental', 'mmap', 'fast-forward']
+
+# Ticks the fast-forward path advances at a time, so escapes have room to skip
+FAST_FORWARD_CHUNK = 25
+
+# Board sizes of the random soups, odd ones included to catch wrap-around bugs
+DEFAULT_SIZES = ['1x1', '2x3', '3x3', '5x8', '16x16', '17x31', '64x64']
+
+# Empty cells between a library spaceship and the blocks around it, close
+# enough that skipping ahead too far runs the ship into them
+FRAME_GAP = 4
+
+
+def state_hash(state: bytes) -> bytes:
+    """Return the digest states are compared by."""
+
+    return hashlib.blake2b(state, digest_size=16).digest()
+
+
+def make_candidate(name, board: Board, ticks):
+    """Return (step, to_bytes, close) functions running a stepping path on a copy of board.
+
+    name is one of engines.ENGINES or EXTRA_CANDIDATES: 'incremental' steps
+    with neighbor counts, 'mmap' a MappedBoard in a temporary directory, and
+    'fast-forward' runs Board.advance() with an EscapeDetector that skips
+    ahead over escaping spaceships. A single tick never leaves anything to
+    skip, so that path advances up to FAST_FORWARD_CHUNK of the ticks ticks
+    at once and to_bytes() returns None until the other calls to step()
+    have caught up with it.
+
+    """
+
+    if name == 'fast-forward':
+        copy = board.clone()
+        copy.escape_detector = EscapeDetector(action='fast-forward')
+        end = board.tick + ticks
+        # Tick the other paths are at, one per call to step()
+        tick = [board.tick]
+
+        def step():
+            tick[0] += 1
+            if copy.tick < tick[0]:
+                copy.advance(min(FAST_FORWARD_CHUNK, end - copy.tick))
+
+        return step, lambda: copy.to_bytes() if copy.tick == tick[0] else None, lambda: None
+
+    if name == 'mmap':
+        directory = tempfile.mkdtemp(prefix='life-crosscheck-')
+        mapped = MappedBoard.from_board(board, directory)
+
+        def close():
+            mapped.close()
+            shutil.rmtree(directory, ignore_errors=True)
+
+        return mapped.step, lambda: mapped.to_board().to_bytes(), close
+
+    copy = board.clone()
+    if name == 'incremental':
+        copy.enable_neighbor_counts()
+    elif name in engines.ENGINES:
+        copy.engine = name
+    else:
+        raise ValueError('Unknown stepping path "{}".'.format(name))
+
+    return copy.step, copy.to_bytes, lambda: None
+
+
+def first_difference(expected: bytes, got: bytes, height, width) -> (int, int, bool):
+    """Return (row, col, expected state) of the first cell that differs between packed states."""
+
+    expected_rows = Board.from_buffer(0, height, width, expected).state
+    got_rows = Board.from_buffer(0, height, width, got).state
+
+    for row in range(height):
+        diff = expected_rows[row].uint ^ got_rows[row].uint
+        if diff:
+            col = width - diff.bit_length()
+            return row, col, expected_rows[row][col]
+
+    return None
+
+
+def cross_check(board: Board, names, ticks) -> dict:
+    """Run every stepping path in names side by side with Board.advance_all() for ticks ticks.
+
+    States are compared by hash after every tick, or whenever a path that
+    advances several ticks at once is at the same tick. Return a dict mapping
+    'reference' and each name to (seconds spent stepping, divergence), where
+    divergence is None or (tick, row, col, expected state) of the first
+    cell found to differ. A path stops at its first divergence.
+
+    """
+
+    reference = board.clone()
+    candidates = {name: make_candidate(name, board, ticks) for name in names}
+    results = {name: [0.0, None] for name in ['reference'] + list(names)}
+
+    try:
+        for tick in range(1, ticks + 1):
+            start = time.perf_counter()
+            reference.advance_all()
+            results['reference'][0] += time.perf_counter() - start
+            expected = reference.to_bytes()
+            expected_hash = state_hash(expected)
+
+            for name, (step, to_bytes, _) in candidates.items():
+                if results[name][1] is not None:
+                    continue
+
+                start = time.perf_counter()
+                step()
+                results[name][0] += time.perf_counter() - start
+
+                got = to_bytes()
+                if got is not None and state_hash(got) != expected_hash:
+                    results[name][1] = (tick,) + first_difference(expected, got, board.height,
+                                                                  board.width)
+    finally:
+        for _, _, close in candidates.values():
+            close()
+
+    return {name: tuple(result) for name, result in results.items()}
+
+
+def block_frame(col, row, width, height, gap) -> list:
+    """Return (col, row) of the cells of blocks framing a box, gap cells away from it.
+
+    Blocks are 2 cells apart, so they stay still, and a spaceship leaving the
+    box in any direction runs into them.
+
+    """
+
+    left, bottom = col - gap - 2, row - gap - 2
+    # Whole steps of 4 cells from the first block to the last
+    right = left + (width + 2 * gap + 5) // 4 * 4
+    top = bottom + (height + 2 * gap + 5) // 4 * 4
+
+    corners = set()
+    for x in range(left, right + 1, 4):
+        corners.update([(x, bottom), (x, top)])
+    for y in range(bottom, top + 1, 4):
+        corners.update([(left, y), (right, y)])
+
+    return [(x + dx, y + dy) for x, y in sorted(corners) for dx in (0, 1) for dy in (0, 1)]
+
+
+def seed_boards(sizes, density, soups, seed, library=None):
+    """Yield (description, Board) of random soups of each size and of every library pattern.
+
+    Patterns are centered on square boards at least twice their size, and
+    spaceships once more inside a frame of blocks, so the fast-forward path
+    has ships to skip ahead that will hit something.
+
+    """
+
+    rng_state = random.getstate()
+    try:
+        for size in sizes:
+            height, width = size
+            for i in range(soups):
+                random.seed('{} {}x{} {}'.format(seed, height, width, i))
+                yield 'soup {}x{} #{}'.format(height, width, i + 1), \
+                    Board(0, height, width, Board.get_random_board(height, width, density))
+    finally:
+        random.setstate(rng_state)
+
+    if library is None:
+        return
+
+    for entry in library.entries:
+        side = max(32, 2 * max(entry.width, entry.height))
+        board = Board(0, side, side)
+        board.set_board_states_from_coords(library.cells(entry.name), 'live', False,
+                                           ((side - entry.width) // 2 - 1,
+                                            (side - entry.height) // 2 - 1))
+        yield 'pattern {}'.format(entry.name), board
+
+        if 'spaceship' not in entry.tags:
+            continue
+
+        side = max(side, max(entry.width, entry.height) + 2 * FRAME_GAP + 12)
+        col, row = (side - entry.width) // 2, (side - entry.height) // 2
+        board = Board(0, side, side)
+        board.set_board_states_from_coords(library.cells(entry.name), 'live', False,
+                                           (col - 1, row - 1))
+        board.set_board_states_from_coords(
+            block_frame(col, row, entry.width, entry.height, FRAME_GAP), 'live')
+        yield 'pattern {} among blocks'.format(entry.name), board
+
+
+def parse_size(value) -> (int, int):
+    """Return (height, width) from "HxW" or a single side length."""
+
+    height, _, width = value.lower().partition('x')
+    try:
+        height = int(height)
+        width = int(width) if width else height
+    except ValueError:
+        raise argparse.ArgumentTypeError('Invalid size "{}", use HxW.'.format(value))
+
+    if height < 1 or width < 1:
+        raise argparse.ArgumentTypeError('Invalid size "{}", use HxW.'.format(value))
+
+    return height, width
+
+
+def main(argv=None):
+    names = [name for name in engines.ENGINES if name != 'scalar'] + EXTRA_CANDIDATES
+
+    parser = argparse.ArgumentParser(
+        description='Check stepping paths against Board.advance_all() and compare their speed.')
+    parser.add_argument('--engines', nargs='+', default=names,
+                        choices=list(engines.ENGINES) + EXTRA_CANDIDATES,
+                        help='stepping paths to check (default: {})'.format(' '.join(names)))
+    parser.add_argument('--ticks', type=int, default=50, help='ticks per seed (default 50)')
+    parser.add_argument('--sizes', type=parse_size, nargs='+',
+                        default=[parse_size(size) for size in DEFAULT_SIZES],
+                        help='sizes of the random soups as HxW (default {})'.format(
+                            ' '.join(DEFAULT_SIZES)))
+    parser.add_argument('--soups', type=int, default=3,
+                        help='random soups per size (default 3)')
+    parser.add_argument('--density', type=float, default=35,
+                        help='percent of living cells in the soups (default 35)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default 0)')
+    parser.add_argument('--no-patterns', dest='patterns', action='store_false',
+                        help='skip the patterns of the pattern library')
+    args = parser.parse_args(argv)
+
+    library = patterns.default_library() if args.patterns else None
+
+    totals = {name: [0.0, 0, 0] for name in ['reference'] + args.engines}
+    seeds = 0
+    for description, board in seed_boards(args.sizes, args.density, args.soups, args.seed,
+                                          library):
+        seeds += 1
+        for name, (seconds, divergence) in cross_check(board, args.engines, args.ticks).items():
+            totals[name][0] += seconds
+            if divergence is None:
+                totals[name][1] += args.ticks
+                continue
+
+            # Only ticks up to the divergence were timed
+            tick, row, col, expected = divergence
+            totals[name][1] += tick
+            totals[name][2] += 1
+            print('{} diverged on {} at tick {}: cell ({}, {}) should be {}.'.format(
+                name, description, tick, col + 1, row + 1, 'alive' if expected else 'dead'))
+
+    reference_per_tick = totals['reference'][0] / max(totals['reference'][1], 1)
+
+    print('\nChecked {} seeds for up to {} ticks each.\n'.format(seeds, args.ticks))
+    print('{:<12}  {:>10}  {:>8}  {}'.format('engine', 'ms/tick', 'speedup', 'result'))
+    for name, (seconds, ticks, failures) in totals.items():
+        per_tick = seconds / max(ticks, 1)
+        print('{:<12}  {:>10.3f}  {:>7.1f}x  {}'.format(
+            name, per_tick * 1000, reference_per_tick / per_tick if per_tick else 0,
+            'diverged on {} of {} seeds'.format(failures, seeds) if failures else 'ok'))
+
+    if any(failures for _, _, failures in totals.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+import os
+from bitstring import BitArray
+
+
+# Directory for files that are expensive to compute but safe to delete
+CACHE_DIR = os.environ.get('LIFE_CACHE_DIR') or \
+    os.path.join(os.path.expanduser('~'), '.cache', 'game-of-life')
+
+# File name of the cached 4x4 -> 2x2 table, inside CACHE_DIR
+BLOCK_TABLE_FILE = 'block_table_4x4_b3s23.bin'
+
+_block_table = None
+
+
+def build_block_table() -> bytes:
+    """Return the table mapping every 4x4 neighborhood to its 2x2 next-generation core.
+
+    The index holds the 4 rows of the neighborhood as nibbles, the row below
+    the block in the top nibble, each with its leftmost cell in the nibble's
+    highest bit. Each entry holds the next states of the block's lower row in
+    bits 3 (left) and 2 (right), and of its upper row in bits 1 and 0.
+
+    """
+
+    table = bytearray(1 << 16)
+
+    for index in range(1 << 16):
+        # grid[row][col], row 0 being the row below the block
+        grid = [[(index >> (15 - 4 * row - col)) & 1 for col in range(4)] for row in range(4)]
+
+        result = 0
+        for row in (1, 2):
+            for col in (1, 2):
+                neighbors = sum(grid[row + try_row][col + try_col]
+                                for try_row in (-1, 0, 1)
+                                for try_col in (-1, 0, 1)
+                                if try_row or try_col)
+                if neighbors == 3 or (neighbors == 2 and grid[row][col]):
+                    result |= 1 << (3 - 2 * (row - 1) - (col - 1))
+        table[index] = result
+
+    return bytes(table)
+
+
+def block_table() -> bytes:
+    """Return the 4x4 -> 2x2 table, loading it from CACHE_DIR or building and saving it."""
+
+    global _block_table
+
+    if _block_table is not None:
+        return _block_table
+
+    path = os.path.join(CACHE_DIR, BLOCK_TABLE_FILE)
+    try:
+        with open(path, 'rb') as f:
+            table = f.read()
+    except OSError:
+        table = b''
+
+    if len(table) != 1 << 16:
+        table = build_block_table()
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write then rename so other processes never read half a table
+            with open(path + '.tmp', 'wb') as f:
+                f.write(table)
+            os.replace(path + '.tmp', path)
+        except OSError:
+            # Unwritable cache, the table is rebuilt next time
+            pass
+
+    _block_table = table
+    return table
+
+
+def _wrapped_row_bytes(row: BitArray, width) -> bytes:
+    """Return the row with one cell of toroidal wrap on each side, packed MSB first.
+
+    Two zero bytes are appended so a 16-bit window can be read at any cell.
+
+    """
+
+    value = row.uint
+    wrapped = ((value & 1) << (width + 1)) | (value << 1) | (value >> (width - 1))
+    nbytes = (width + 2 + 7) // 8 + 2
+
+    return (wrapped << (nbytes * 8 - width - 2)).to_bytes(nbytes, 'big')
+
+
+def step_lut(board):
+    """Advance the board by one tick with 2x2 blocks looked up in block_table().
+
+    Blocks start at even rows and columns. On boards with an odd height or
+    width the last block overlaps the one before it, which is harmless since
+    every block is computed from the previous generation. Rows that don't
+    change keep their BitArray, so copy-on-write sharing with clones and
+    history snapshots survives the tick.
+
+    """
+
+    height, width = board.height, board.width
+    if height < 2 or width < 2:
+        board.advance_all()
+        return
+
+    table = block_table()
+    state = board.state
+    wrapped = [_wrapped_row_bytes(row, width) for row in state]
+
+    block_cols = list(range(0, width - 1, 2))
+    if width % 2:
+        block_cols.append(width - 2)
+    block_rows = list(range(0, height - 1, 2))
+    if height % 2:
+        block_rows.append(height - 2)
+
+    # (byte index, shift) of the 4 cells around each block's left column
+    windows = [(col >> 3, 12 - (col & 7), width - 2 - col) for col in block_cols]
+
+    new_values = {}
+    for row in block_rows:
+        below = wrapped[row - 1]
+        lower = wrapped[row]
+        upper = wrapped[row + 1]
+        above = wrapped[(row + 2) % height]
+
+        lower_value = 0
+        upper_value = 0
+        for byte, shift, out_shift in windows:
+            index = ((((below[byte] << 8) | below[byte + 1]) >> shift) & 15) << 12 \
+                | ((((lower[byte] << 8) | lower[byte + 1]) >> shift) & 15) << 8 \
+                | ((((upper[byte] << 8) | upper[byte + 1]) >> shift) & 15) << 4 \
+                | (((above[byte] << 8) | above[byte + 1]) >> shift) & 15
+            result = table[index]
+            lower_value |= (result >> 2) << out_shift
+            upper_value |= (result & 3) << out_shift
+
+        new_values[row] = lower_value
+        new_values[row + 1] = upper_value
+
+    # Only replace rows that changed
+    for row, value in new_values.items():
+        if value != state[row].uint:
+            state[row] = BitArray(uint=value, length=width)
+            board.shared_rows.discard(row)
+
+
+def next_row_value(below, row, above, width) -> int:
+    """Return the next generation of a row, given it and its neighbor rows as ints.
+
+    Each int holds width cells with column 0 in the most significant bit.
+    All cells of the row are computed at once: the 8 neighbor rows (the
+    rows shifted one column each way, with toroidal wrap) are added with
+    bit-sliced adders, giving the neighbor count of every cell mod 8 in
+    three ints. Counts of 2 and 3 are the only ones that matter and 8
+    neighbors can't be mistaken for either.
+
+    """
+
+    mask = (1 << width) - 1
+
+    # The cells above and below, then those to the left and right of all
+    # three rows, wrapping around the board
+    neighbors = [below, above]
+    for value in (below, row, above):
+        neighbors.append((value >> 1) | ((value & 1) << (width - 1)))
+        neighbors.append(((value << 1) | (value >> (width - 1))) & mask)
+
+    ones = twos = fours = 0
+    for neighbor in neighbors:
+        carry = ones & neighbor
+        ones ^= neighbor
+        fours ^= twos & carry
+        twos ^= carry
+
+    # 3 neighbors, or 2 neighbors and alive
+    return twos & ~fours & (ones | row)
+
+
+def step_bitwise(board):
+    """Advance the board by one tick, a whole row at a time with next_row_value().
+
+    Rows that don't change keep their BitArray, like in step_lut().
+
+    """
+
+    height, width = board.height, board.width
+    state = board.state
+    values = [row.uint for row in state]
+
+    new_values = [next_row_value(values[row - 1], values[row], values[(row + 1) % height], width)
+                  for row in range(height)]
+
+    for row, value in enumerate(new_values):
+        if value != values[row]:
+            state[row] = BitArray(uint=value, length=width)
+            board.shared_rows.discard(row)
+
+
+def step_scalar(board):
+    """Advance the board by one tick with the reference Board.advance_all()."""
+
+    board.advance_all()
+
+
+# Stepping engines by name, see Board.engine
+ENGINES = {
+    'scalar': step_scalar,
+    'lut': step_lut,
+    'bitwise': step_bitwise,
+}
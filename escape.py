@@ -0,0 +1,357 @@
+from collections import Counter, deque
+
+from bitstring import BitArray
+
+import census
+from patterns import normalize
+
+
+class Escape:
+    """What an EscapeDetector found: spaceships translating over otherwise periodic debris."""
+
+    def __init__(self, tick, period, ships):
+        """Initialize Escape object.
+
+        Arguments:
+            tick: Int tick the escape was detected at.
+            period: Int number of ticks after which the board repeats up to
+                the spaceships' displacement.
+            ships: Counter of (name, (cols, rows) moved per period) of the
+                spaceships, rows counting upwards.
+
+        """
+
+        self.tick = tick
+        self.period = period
+        self.ships = ships
+
+    def __str__(self):
+        s = 'Only spaceships are moving at tick {} (period {}):'.format(self.tick, self.period)
+        for (name, (dx, dy)), count in sorted(self.ships.items()):
+            s += '\n\t{} x {} moving ({:+d}, {:+d}) every {} ticks'.format(
+                count, name, dx, dy, self.period)
+
+        return s
+
+
+def _box(cells, height, width) -> (int, int, int, int):
+    """Return (row, height, col, width) of the smallest box holding cells on the torus."""
+
+    rows = census.unwrap([row for row, _ in cells], height)
+    cols = census.unwrap([col for _, col in cells], width)
+
+    # The board coordinates of the lowest unwrapped row and column
+    bottom = min(rows, key=rows.get)
+    left = min(cols, key=cols.get)
+
+    return bottom, rows[max(rows, key=rows.get)] - rows[bottom] + 1, \
+        left, cols[max(cols, key=cols.get)] - cols[left] + 1
+
+
+def _boxes_overlap(a, b, height, width) -> bool:
+    """Return true if two (row, height, col, width) boxes overlap on the torus."""
+
+    for start_a, size_a, start_b, size_b, size in ((a[0], a[1], b[0], b[1], height),
+                                                   (a[2], a[3], b[2], b[3], width)):
+        if size_a < size and size_b < size and (start_b - start_a) % size >= size_a \
+                and (start_a - start_b) % size >= size_b:
+            return False
+
+    return True
+
+
+def _grow(box, margin) -> (int, int, int, int):
+    """Return a box widened by margin cells on every side."""
+
+    return box[0] - margin, box[1] + 2 * margin, box[2] - margin, box[3] + 2 * margin
+
+
+class EscapeDetector:
+    """Recognizes when the only activity left on a board is translating spaceships.
+
+    A generation is hashed twice: the cells of everything that isn't a known
+    spaceship are hashed with their positions, and the spaceships are hashed
+    by shape only, ignoring where they are. When both hashes match a
+    generation up to max_period ticks earlier and the spaceships have moved,
+    the board has become still lifes and oscillators plus spaceships flying
+    away, which period detection alone never notices on a torus.
+
+    Labeling objects costs several ticks' worth of stepping, so generations
+    are only hashed once the population has repeated with the same period
+    for a whole period, and never for boards that repeat exactly. Until
+    then, update() only counts cells and keeps references to the rows.
+
+    """
+
+    def __init__(self, max_period=12, library=None, action='stop'):
+        """Initialize EscapeDetector object.
+
+        Arguments:
+            max_period: Int longest period looked for; must be a multiple of
+                the periods of the debris and the spaceships together, so the
+                default 12 covers glider and *WSS (4) among period 2 and 3
+                oscillators.
+            library: patterns.PatternLibrary whose spaceships are recognized
+                too, or None.
+            action: What Board.tick_board() and Board.advance() do on an
+                escape: 'stop' the run, or 'fast-forward' it by moving the
+                spaceships ahead whole periods at a time, for as long as they
+                stay clear of everything else.
+
+        """
+
+        if action not in ['stop', 'fast-forward']:
+            raise ValueError('Unknown escape action "{}".'.format(action))
+
+        self.max_period = max_period
+        self.library = library
+        self.action = action
+        self.report = None
+
+        # Tick of the last generation seen
+        self.tick = None
+
+        # Total number of ticks fast_forward() skipped
+        self.skipped = 0
+
+        # Populations and rows of the last generations, and the hashes of
+        # those that were needed, by tick
+        self._populations = deque(maxlen=2 * max_period)
+        self._states = deque(maxlen=max_period + 1)
+        self._generations = {}
+
+        # Population of each row of the last generation, by id() of its BitArray
+        self._row_counts = {}
+
+        # (cells, displacement per period) of each ship of the last report
+        self._moves = None
+
+    def reset(self):
+        """Forget earlier generations, e.g. after the board was edited."""
+
+        self._populations.clear()
+        self._states.clear()
+        self._generations.clear()
+        self._row_counts = {}
+        self.report = None
+        self.tick = None
+        self._moves = None
+
+    def update(self, board) -> Escape:
+        """Look at the board's current generation and return an Escape if one is detected.
+
+        Must be called once per tick to find periods correctly. The result
+        is also kept in self.report.
+
+        """
+
+        if self.tick is not None and board.tick != self.tick + 1:
+            self.reset()
+
+        rows = tuple(board.state)
+
+        # Rows the last tick didn't replace keep their count
+        counts = self._row_counts
+        self._row_counts = {id(row): counts[id(row)] if id(row) in counts
+                            else bin(row.uint).count('1') for row in rows}
+        self._populations.append(sum(self._row_counts.values()))
+        self._states.append((board.tick, rows))
+        # The board must copy rows before changing them, like for a History
+        board.shared_rows = set(range(board.height))
+
+        # Hashes of generations that are no longer kept
+        oldest = self._states[0][0]
+        for tick in [tick for tick in self._generations if tick < oldest]:
+            del self._generations[tick]
+
+        self.tick = board.tick
+        self.report = None
+        self._moves = None
+
+        # Periods over which the population repeated for a whole period
+        populations = self._populations
+        periods = [period for period in range(1, self.max_period + 1)
+                   if len(populations) >= 2 * period
+                   and all(populations[-1 - i] == populations[-1 - period - i]
+                           for i in range(period))]
+
+        # Nothing is moving if everything repeats exactly
+        for period in periods:
+            earlier_rows = self._states[-1 - period][1]
+            if all(a is b or a == b for a, b in zip(earlier_rows, rows)):
+                return None
+
+        for period in periods:
+            generation = self._generation(board, -1)
+            if not generation[2]:
+                # No spaceships
+                break
+
+            earlier = self._generation(board, -1 - period)
+            if earlier[:2] != generation[:2]:
+                continue
+
+            moves = self._displacements(board, earlier[2], generation[2])
+            if moves is not None:
+                self._moves = moves
+                self.report = Escape(board.tick, period, Counter(
+                    (name, move) for (_, _, _, name), (_, move) in zip(generation[2], moves)))
+                break
+
+        return self.report
+
+    def _generation(self, board, index):
+        """Return (debris hash, ship shapes hash, ships, debris) of a kept generation.
+
+        ships holds (shape, position, cells, name) of each spaceship and
+        debris the cells of every other object, both as lists of (row, col).
+
+        """
+
+        from life import Board
+
+        tick, rows = self._states[index]
+        if tick in self._generations:
+            return self._generations[tick]
+
+        debris = []
+        ships = []
+        snapshot = Board(tick, board.height, board.width, list(rows), False)
+        for name, kind, cells in census.find_objects(snapshot, self.library):
+            if kind != 'spaceship':
+                debris.append(cells)
+                continue
+
+            # Ships crossing the board edge are moved into one piece first
+            unwrapped_rows = census.unwrap([row for row, _ in cells], board.height)
+            unwrapped_cols = census.unwrap([col for _, col in cells], board.width)
+            unwrapped = sorted((unwrapped_cols[col], unwrapped_rows[row], col, row)
+                               for row, col in cells)
+
+            # Orientation matters here, unlike in census canonical forms;
+            # the position is where the shape's first cell is on the board
+            shape, _ = normalize([(x, y) for x, y, _, _ in unwrapped])
+            ships.append((shape, unwrapped[0][2:], cells, name))
+
+        generation = (hash(frozenset(cell for cells in debris for cell in cells)),
+                      hash(tuple(sorted(shape for shape, _, _, _ in ships))),
+                      ships, debris)
+        self._generations[tick] = generation
+
+        return generation
+
+    @staticmethod
+    def _displacements(board, before, after) -> list:
+        """Return (cells, displacement) of each ship of after, paired with a ship of before.
+
+        Ships are paired with the earlier ship of the same shape that is
+        closest on the torus. None means nothing moved.
+
+        """
+
+        moves = []
+        any_moved = False
+        remaining = list(before)
+
+        for shape, (x, y), cells, _ in after:
+            best = None
+            for i, (old_shape, (old_x, old_y), _, _) in enumerate(remaining):
+                if old_shape != shape:
+                    continue
+                # Shortest displacement around the torus
+                dx = (x - old_x + board.width // 2) % board.width - board.width // 2
+                dy = (y - old_y + board.height // 2) % board.height - board.height // 2
+                if best is None or abs(dx) + abs(dy) < abs(best[1][0]) + abs(best[1][1]):
+                    best = i, (dx, dy)
+
+            if best is None:
+                return None
+
+            remaining.pop(best[0])
+            moves.append((cells, best[1]))
+            any_moved = any_moved or best[1] != (0, 0)
+
+        return moves if any_moved else None
+
+    def safe_periods(self, board, limit) -> int:
+        """Return how many whole periods, up to limit, the ships of the last report can skip.
+
+        Skipping is safe while every ship, widened by how far it can reach
+        within a period plus the 2 cells over which objects interact, stays
+        clear of the boxes of the other objects in every phase of the last
+        period and of the other ships on their own paths.
+
+        """
+
+        if self.report is None or limit <= 0:
+            return 0
+
+        height, width = board.height, board.width
+        period = self.report.period
+
+        # Everything that isn't a ship, in every phase of the last period
+        debris = [_box(cells, height, width)
+                  for index in range(-period, 0)
+                  for cells in self._generation(board, index)[3]]
+
+        ships = []
+        for cells, (dx, dy) in self._moves:
+            box = _grow(_box(cells, height, width), 3 + max(abs(dx), abs(dy)))
+            # A ship this close to its own wrap-around would run into itself
+            if box[1] >= height or box[3] >= width:
+                return 0
+            ships.append((box, dx, dy))
+
+        for periods in range(limit + 1):
+            moved = [(row + periods * dy, rows, col + periods * dx, cols)
+                     for (row, rows, col, cols), dx, dy in ships]
+            for i, box in enumerate(moved):
+                if any(_boxes_overlap(box, other, height, width) for other in debris) or \
+                        any(_boxes_overlap(box, other, height, width) for other in moved[i + 1:]):
+                    return max(periods - 1, 0)
+
+        return limit
+
+    def jump(self, board, periods):
+        """Move the ships of the last report ahead by whole periods, advancing the tick.
+
+        Only valid for up to safe_periods() periods. The detector starts over
+        afterwards.
+
+        """
+
+        height, width = board.height, board.width
+        values = [row.uint for row in board.state]
+
+        for cells, _ in self._moves:
+            for row, col in cells:
+                values[row] &= ~(1 << (width - 1 - col))
+        for cells, (dx, dy) in self._moves:
+            for row, col in cells:
+                values[(row + periods * dy) % height] |= \
+                    1 << (width - 1 - (col + periods * dx) % width)
+
+        # Rows without ships keep their BitArray
+        board.set_state([row if row.uint == value else BitArray(uint=value, length=width)
+                         for row, value in zip(board.state, values)], True)
+        board.tick += periods * self.report.period
+
+        self.reset()
+
+    def fast_forward(self, board, max_ticks) -> int:
+        """Skip as many ticks as is safe, up to max_ticks, after an escape was reported.
+
+        Return the number of ticks skipped.
+
+        """
+
+        if self.report is None:
+            return 0
+
+        period = self.report.period
+        periods = self.safe_periods(board, max_ticks // period)
+        if periods:
+            self.jump(board, periods)
+        self.skipped += periods * period
+
+        return periods * period
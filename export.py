@@ -0,0 +1,339 @@
+import os
+import zlib
+import struct
+from typing import List
+
+
+# Living cells are black and dead cells white in every format
+DEAD_RGB = (255, 255, 255)
+LIVE_RGB = (0, 0, 0)
+
+# GIF LZW codes start at this many bits (2 is the smallest GIF allows)
+GIF_MIN_CODE_SIZE = 2
+
+# File extensions export_frame() and export_run() know
+IMAGE_EXTENSIONS = ['.png', '.pbm']
+
+# Swaps 0 and 1 bits of packed pixels, for formats where 1 is white
+_INVERT = bytes(255 - i for i in range(256))
+
+_bit_tables = {}
+_pixel_tables = {}
+
+
+def _bit_table(scale) -> List[bytes]:
+    """Return the table expanding a byte of packed cells to scale bytes of packed pixels."""
+
+    if scale not in _bit_tables:
+        table = []
+        for value in range(256):
+            bits = 0
+            for bit in range(7, -1, -1):
+                cell = (value >> bit) & 1
+                bits = (bits << scale) | (cell * ((1 << scale) - 1))
+            table.append(bits.to_bytes(scale, 'big'))
+        _bit_tables[scale] = table
+
+    return _bit_tables[scale]
+
+
+def _pixel_table(scale) -> List[bytes]:
+    """Return the table expanding a byte of packed cells to 8 * scale one-byte pixels."""
+
+    if scale not in _pixel_tables:
+        _pixel_tables[scale] = [
+            b''.join(bytes([(value >> bit) & 1]) * scale for bit in range(7, -1, -1))
+            for value in range(256)]
+
+    return _pixel_tables[scale]
+
+
+def packed_rows(board) -> List[bytes]:
+    """Return the board's rows packed 8 cells per byte, top row first as images are stored."""
+
+    return [row.tobytes() for row in reversed(board.state)]
+
+
+def scale_row(row: bytes, width, scale) -> bytes:
+    """Return a packed row of width cells with every cell widened to scale pixels.
+
+    Whole bytes are expanded through a lookup table instead of cell by cell;
+    the zero padding of the last byte expands to zero padding.
+
+    """
+
+    if scale == 1:
+        return row
+
+    table = _bit_table(scale)
+    return b''.join([table[value] for value in row])[:(width * scale + 7) // 8]
+
+
+def pixel_row(row: bytes, width, scale=1, start=0, stop=None) -> bytes:
+    """Return columns start to stop of a packed row as one byte (0 or 1) per pixel, scaled."""
+
+    if stop is None:
+        stop = width
+
+    table = _pixel_table(scale)
+    first = start // 8
+    pixels = b''.join([table[value] for value in row[first:(stop + 7) // 8]])
+
+    return pixels[(start - first * 8) * scale:(stop - first * 8) * scale]
+
+
+def write_pbm(board, path, scale=1):
+    """Write the board to path as a binary (P4) PBM image, scale pixels per cell."""
+
+    width = board.width * scale
+    with open(path, 'wb') as f:
+        f.write('P4\n{} {}\n'.format(width, board.height * scale).encode())
+        # PBM uses 1 for black, the same bits as the board
+        for row in packed_rows(board):
+            f.write(scale_row(row, board.width, scale) * scale)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    """Return a PNG chunk with its length and CRC."""
+
+    return struct.pack('>I', len(data)) + kind + data + \
+        struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+
+def write_png(board, path, scale=1):
+    """Write the board to path as a 1-bit grayscale PNG image, scale pixels per cell.
+
+    Rows are compressed as they are expanded rather than after building the
+    whole image.
+
+    """
+
+    compressor = zlib.compressobj(9)
+    data = []
+    for row in packed_rows(board):
+        # Filter type 0, then pixels where 1 is white
+        line = b'\x00' + scale_row(row, board.width, scale).translate(_INVERT)
+        data.append(compressor.compress(line * scale))
+    data.append(compressor.flush())
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', board.width * scale,
+                                                board.height * scale, 1, 0, 0, 0, 0)))
+        f.write(_png_chunk(b'IDAT', b''.join(data)))
+        f.write(_png_chunk(b'IEND', b''))
+
+
+def lzw_encode(pixels: bytes, min_code_size=GIF_MIN_CODE_SIZE) -> bytes:
+    """Return pixels compressed with GIF's variable-length LZW, codes packed LSB first.
+
+    The table is reset with a clear code whenever it fills up at 4096 codes.
+
+    """
+
+    clear = 1 << min_code_size
+    end = clear + 1
+
+    out = bytearray()
+    bit_buffer = clear
+    bit_count = code_size = min_code_size + 1
+
+    if not pixels:
+        bit_buffer |= end << bit_count
+        bit_count += code_size
+        return bytes(out) + bit_buffer.to_bytes((bit_count + 7) // 8, 'little')
+
+    # Strings are keyed by (code of their prefix) << 8 | last pixel
+    table = {}
+    next_code = end + 1
+    prefix = pixels[0]
+
+    for pixel in pixels[1:]:
+        key = (prefix << 8) | pixel
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+
+        bit_buffer |= prefix << bit_count
+        bit_count += code_size
+
+        if next_code == 4096:
+            # Full table, start over
+            bit_buffer |= clear << bit_count
+            bit_count += code_size
+            table.clear()
+            next_code = end + 1
+            code_size = min_code_size + 1
+        else:
+            table[key] = next_code
+            # Decoders widen codes once they add this entry, a code later
+            if next_code == 1 << code_size:
+                code_size += 1
+            next_code += 1
+
+        # Move whole bytes out of the buffer
+        if bit_count >= 64:
+            nbytes = bit_count // 8
+            out += (bit_buffer & ((1 << (nbytes * 8)) - 1)).to_bytes(nbytes, 'little')
+            bit_buffer >>= nbytes * 8
+            bit_count -= nbytes * 8
+
+        prefix = pixel
+
+    for code in (prefix, end):
+        bit_buffer |= code << bit_count
+        bit_count += code_size
+        if code == prefix and next_code < 4096 and next_code == 1 << code_size:
+            # The decoder adds one more entry before reading the end code
+            code_size += 1
+
+    return bytes(out) + bit_buffer.to_bytes((bit_count + 7) // 8, 'little')
+
+
+class GifWriter:
+    """Writes an animated GIF one frame at a time.
+
+    Frames are written as they are added, so only the previous frame's rows
+    are kept in memory. Each frame only covers the rectangle of cells that
+    changed since the previous one, which is drawn over it, so still regions
+    of a board are neither expanded nor compressed again.
+
+    """
+
+    def __init__(self, path, height, width, scale=1, delay_ms=100, loop=0):
+        """Open path and write the GIF header.
+
+        Arguments:
+            path: Path of the GIF file.
+            height: Int height of the boards in cells.
+            width: Int width of the boards in cells.
+            scale: Int number of pixels per cell in each direction.
+            delay_ms: Int milliseconds each frame is shown, rounded down to
+                hundredths of a second.
+            loop: Int number of times the animation repeats, 0 for forever.
+
+        """
+
+        self.height = height
+        self.width = width
+        self.scale = scale
+        self.delay = delay_ms // 10
+        self.frames = 0
+        self._previous = None
+
+        self._file = open(path, 'wb')
+        self._file.write(b'GIF89a' + struct.pack('<HHBBB', width * scale, height * scale,
+                                                 0x80, 0, 0))
+        self._file.write(bytes(DEAD_RGB + LIVE_RGB))
+        self._file.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, board):
+        """Append the board's current state as the next frame."""
+
+        if (board.height, board.width) != (self.height, self.width):
+            raise ValueError('Board must be {}x{} to be added.'.format(self.height, self.width))
+
+        rows = packed_rows(board)
+        values = [int.from_bytes(row, 'big') for row in rows]
+
+        if self._previous is None:
+            top, bottom, left, right = 0, self.height - 1, 0, self.width - 1
+        else:
+            changed = [i for i, value in enumerate(values) if value != self._previous[i]]
+            if not changed:
+                # Nothing to draw, but the frame still has to be shown
+                changed = [0]
+                diff = 1 << (len(rows[0]) * 8 - 1)
+            else:
+                diff = 0
+                for i in changed:
+                    diff |= values[i] ^ self._previous[i]
+
+            top, bottom = changed[0], changed[-1]
+            # Columns from the most significant bit of the packed bytes
+            pad = len(rows[0]) * 8
+            left = pad - diff.bit_length()
+            right = pad - (diff & -diff).bit_length()
+
+        self._previous = values
+
+        scale = self.scale
+        pixels = b''.join([pixel_row(rows[i], self.width, scale, left, right + 1) * scale
+                           for i in range(top, bottom + 1)])
+        data = lzw_encode(pixels)
+
+        f = self._file
+        # Graphic control: keep the previous frame underneath, then wait
+        f.write(b'\x21\xf9\x04\x04' + struct.pack('<H', self.delay) + b'\x00\x00')
+        f.write(b'\x2c' + struct.pack('<HHHHB', left * scale, top * scale,
+                                      (right - left + 1) * scale, (bottom - top + 1) * scale, 0))
+        f.write(bytes([GIF_MIN_CODE_SIZE]))
+        for start in range(0, len(data), 255):
+            block = data[start:start + 255]
+            f.write(bytes([len(block)]) + block)
+        f.write(b'\x00')
+
+        self.frames += 1
+
+    def close(self):
+        """Write the GIF trailer and close the file."""
+
+        if not self._file.closed:
+            self._file.write(b'\x3b')
+            self._file.close()
+
+
+def export_frame(board, path, scale=1):
+    """Write the board as an image, PNG or PBM depending on path's extension."""
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.png':
+        write_png(board, path, scale)
+    elif extension == '.pbm':
+        write_pbm(board, path, scale)
+    else:
+        raise ValueError('Unknown image type "{}", use one of {}.'.format(
+            extension, ', '.join(IMAGE_EXTENSIONS)))
+
+
+def export_run(board, path, num_ticks, every=1, scale=1, delay_ms=100) -> int:
+    """Export the current generation and the next num_ticks ticks, every few ticks.
+
+    A path ending in .gif gets an animated GIF. Otherwise path must be a
+    format string for the image of each generation, given its tick, e.g.
+    "frames/tick_{:06d}.png". The run is made on a clone, without the result
+    cache, so the board itself doesn't advance. Return the number of frames
+    written.
+
+    """
+
+    run = board.clone()
+    # Frames are a few ticks apart, caching each of them would only evict useful entries
+    run.result_cache = None
+
+    if os.path.splitext(path)[1].lower() == '.gif':
+        with GifWriter(path, board.height, board.width, scale, delay_ms) as gif:
+            gif.add(run)
+            for _ in range(num_ticks // every):
+                run.advance(every)
+                gif.add(run)
+            return gif.frames
+
+    if path.format(0) == path:
+        raise ValueError('Path of a frame sequence must contain a "{}" for the tick.')
+    os.makedirs(os.path.dirname(path.format(0)) or '.', exist_ok=True)
+
+    frames = 0
+    while True:
+        export_frame(run, path.format(run.tick), scale)
+        frames += 1
+        if run.tick + every > board.tick + num_ticks:
+            return frames
+        run.advance(every)
@@ -0,0 +1,181 @@
+import sys
+from typing import List
+
+
+def _row_nbytes(row, entry) -> int:
+    """Return the memory a referenced row takes: the BitArray, its buffer and its History entry."""
+
+    store = row._datastore
+    return sys.getsizeof(row) + sys.getsizeof(store) + sys.getsizeof(store._rawarray) + \
+        sys.getsizeof(entry) + sys.getsizeof(id(row))
+
+
+def _snapshot_nbytes(snapshot) -> int:
+    """Return the memory a Snapshot takes besides its rows: the object and its tuple of rows."""
+
+    return sys.getsizeof(snapshot) + sys.getsizeof(snapshot.__dict__) + \
+        sys.getsizeof(snapshot.rows)
+
+
+class Snapshot:
+    """One recorded generation: its tick and the row objects it was made of."""
+
+    def __init__(self, tick, rows: tuple, label=''):
+        """Initialize Snapshot object."""
+
+        self.tick = tick
+        self.rows = rows
+        self.label = label
+
+
+class History:
+    """Bounded undo/redo history of a Board's generations.
+
+    Snapshots keep references to the board's row BitArrays instead of copies.
+    Recording marks every row of the board as shared (see Board.writable_row()),
+    so the board copies a row the first time it changes it afterwards and the
+    recorded row stays intact. Rows that don't change between generations are
+    stored once no matter how many snapshots use them, so memory grows with the
+    amount of change rather than with the number of generations.
+
+    nbytes counts the memory the history keeps alive: every row it references
+    once, each snapshot with its tuple of rows, and the history's own
+    containers. When it exceeds
+    max_bytes (or there are more than max_generations snapshots), the oldest
+    snapshots are evicted.
+
+    """
+
+    def __init__(self, max_bytes=64 * 2**20, max_generations=None):
+        """Initialize History object.
+
+        Arguments:
+            max_bytes: Int cap on the bytes of memory kept alive by the history.
+            max_generations: Int cap on the number of snapshots, or None.
+
+        """
+
+        self.max_bytes = max_bytes
+        self.max_generations = max_generations
+        self.snapshots: List[Snapshot] = []
+        self.cursor = -1
+
+        # Memory of the snapshots and rows, without the containers holding them
+        self._nbytes = 0
+
+        # id(row) -> [row, number of snapshots referencing it]
+        self._rows = {}
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes of memory kept alive by the history."""
+
+        return self._nbytes + sys.getsizeof(self.snapshots) + sys.getsizeof(self._rows)
+
+    @property
+    def current(self) -> Snapshot:
+        """Return the snapshot the board was last recorded at or restored to."""
+
+        return self.snapshots[self.cursor] if self.snapshots else None
+
+    def record(self, board, label=''):
+        """Record the board's current generation after the cursor.
+
+        Snapshots after the cursor (generations that were undone) are dropped,
+        and nothing is recorded if the board hasn't changed since the current
+        snapshot.
+
+        """
+
+        rows = tuple(board.state)
+
+        current = self.current
+        if current is not None and current.tick == board.tick \
+                and len(current.rows) == len(rows) \
+                and all(a is b for a, b in zip(current.rows, rows)):
+            return
+
+        # Forget the redo branch
+        while len(self.snapshots) > self.cursor + 1:
+            self._release(self.snapshots.pop())
+
+        self.snapshots.append(Snapshot(board.tick, rows, label))
+        self.cursor = len(self.snapshots) - 1
+        self._nbytes += _snapshot_nbytes(self.snapshots[-1])
+        for row in rows:
+            entry = self._rows.get(id(row))
+            if entry is None:
+                entry = self._rows[id(row)] = [row, 1]
+                self._nbytes += _row_nbytes(row, entry)
+            else:
+                entry[1] += 1
+
+        # The board must copy rows before changing them from now on
+        board.shared_rows = set(range(len(rows)))
+
+        self._evict()
+
+    def undo(self, board) -> bool:
+        """Restore the generation before the current one, return false if there is none."""
+
+        if self.cursor <= 0:
+            return False
+
+        self.restore(board, self.cursor - 1)
+        return True
+
+    def redo(self, board) -> bool:
+        """Restore the generation after the current one, return false if there is none."""
+
+        if self.cursor >= len(self.snapshots) - 1:
+            return False
+
+        self.restore(board, self.cursor + 1)
+        return True
+
+    def rewind(self, board, tick) -> bool:
+        """Restore the latest recorded generation at or before tick, return false if none is kept."""
+
+        for i in range(self.cursor, -1, -1):
+            if self.snapshots[i].tick <= tick:
+                self.restore(board, i)
+                return True
+
+        return False
+
+    def restore(self, board, index):
+        """Make the board match the snapshot at index and move the cursor there."""
+
+        snapshot = self.snapshots[index]
+        if len(snapshot.rows) != board.height:
+            raise ValueError('Snapshot has {} rows, board has {}.'.format(
+                len(snapshot.rows), board.height))
+
+        board.set_state(list(snapshot.rows), True)
+        board.tick = snapshot.tick
+        self.cursor = index
+
+    def _release(self, snapshot: Snapshot):
+        """Drop a snapshot's references to its rows."""
+
+        self._nbytes -= _snapshot_nbytes(snapshot)
+        for row in snapshot.rows:
+            entry = self._rows[id(row)]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._rows[id(row)]
+                self._nbytes -= _row_nbytes(row, entry)
+
+    def _evict(self):
+        """Drop the oldest snapshots until the history is within its caps."""
+
+        # The current snapshot is always kept
+        while self.cursor > 0 and (
+                self.nbytes > self.max_bytes
+                or (self.max_generations is not None
+                    and len(self.snapshots) > self.max_generations)):
+            self._release(self.snapshots.pop(0))
+            self.cursor -= 1
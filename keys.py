@@ -0,0 +1,84 @@
+import os
+import sys
+import time
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import select
+    import termios
+    import tty
+
+
+class KeyReader:
+    """Reads single keypresses from the terminal without waiting for enter.
+
+    Use as a context manager: on POSIX the terminal is put in cbreak mode
+    (keys are delivered one at a time and not echoed, Ctrl+C still
+    interrupts) and restored on exit; on Windows msvcrt is polled. If the
+    stream isn't a terminal, e.g. when input is piped, reads don't time out:
+    each one waits for the next character, so scripted keys are replayed one
+    per read.
+
+    """
+
+    def __init__(self, stream=sys.stdin):
+        """Initialize KeyReader object.
+
+        Arguments:
+            stream: File object to read keys from.
+
+        """
+
+        self.stream = stream
+        self._saved = None
+
+    def __enter__(self):
+        if msvcrt is None and self.stream.isatty():
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+
+        return self
+
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            # Drop unread keys, like the rest of an arrow key's escape
+            # sequence, so the next input() doesn't read them
+            termios.tcflush(self.stream.fileno(), termios.TCIFLUSH)
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def read(self, timeout=None) -> str:
+        """Return the next key pressed within timeout seconds, or None.
+
+        A timeout of None waits until a key is pressed. Return '' once the
+        input is closed.
+
+        """
+
+        if not self.stream.isatty():
+            return self.stream.read(1)
+
+        if msvcrt is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not msvcrt.kbhit():
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.01)
+
+            key = msvcrt.getwch()
+            # Arrow and function keys come as two characters, drop the second
+            if key in '\x00\xe0':
+                msvcrt.getwch()
+                return None
+            return key
+
+        readable, _, _ = select.select([self.stream], [], [], timeout)
+        if not readable:
+            return None
+
+        # Bypass Python's buffering so select() sees every unread key; in
+        # cbreak mode input() has left nothing buffered
+        return os.read(self.stream.fileno(), 1).decode(errors='replace')
@@ -0,0 +1,999 @@
+import os
+import time
+import random
+import copy
+from typing import List
+from bitstring import BitArray, CreationError
+import engines
+
+
+# Edits of more cells than this are summarized instead of listed cell by cell
+MAX_CELL_MESSAGES = 20
+
+# Birth/survival rule every engine implements, part of result cache keys
+RULE = 'B3/S23'
+
+
+class Board:
+
+    alive_char = '█'
+    dead_char = '░'
+    dead_char_dark = '▒'
+
+    def __init__(self, tick, height, width, state: List[List[BitArray]] = None, validate=True):
+        """Initialize Board object."""
+
+        if state is None:
+            state = self.get_blank_board(height, width)
+        elif validate:
+            # Confirm height and width are correct if state is defined
+            assert len(state) == height
+            assert all([len(row) == len(state[0]) == width for row in state])
+
+        self.tick = tick
+        self.height = height
+        self.width = width
+        self.state = state
+
+        # Indices of rows whose BitArray is shared with a clone of this board.
+        # They are copied before their first change (see writable_row()).
+        self.shared_rows = set()
+
+        # Region copied in board editing mode, as a list of BitArray rows
+        self.clipboard = None
+
+        # History recording each generation and edit, if any
+        self.history = None
+
+        # Optional count of living neighbors of every cell, as a list of
+        # bytearray rows kept in sync by live() and die(), and the cells whose
+        # state or count changed since the last generation (see
+        # enable_neighbor_counts())
+        self.neighbor_counts = None
+        self.dirty_cells = None
+
+        # Verify neighbor_counts against a full recount after every step
+        self.check_counts = False
+
+        # Name of the engine in engines.ENGINES used by step()
+        self.engine = 'scalar'
+
+        # ResultCache consulted by advance() and tick_board(), if any
+        self.result_cache = None
+
+        # escape.EscapeDetector watched by advance() and tick_board(), if any
+        self.escape_detector = None
+
+    @classmethod
+    def from_buffer(cls, tick, height, width, buffer):
+        """Return a Board built from one contiguous buffer of packed rows.
+
+        Arguments:
+            tick: Int tick of the new board.
+            height: Int height of the board.
+            width: Int width of the board.
+            buffer: Any of:
+                - None, for a board of dead cells
+                - a bytes-like object holding height rows of ceil(width / 8)
+                  bytes each, bottom row first, most significant bit first
+                  (the layout returned by to_bytes())
+                - a NumPy array of shape (height, width) of cell states, or of
+                  shape (height, ceil(width / 8)) and dtype uint8 holding
+                  packed rows
+                - another Board, which is cloned (see clone())
+
+        Only the size of the buffer is checked against height and width, so
+        validation doesn't depend on the size of the board.
+
+        """
+
+        if buffer is None:
+            return cls(tick, height, width)
+
+        if isinstance(buffer, Board):
+            if (buffer.height, buffer.width) != (height, width):
+                raise ValueError('Board is {}x{}, expected {}x{}.'.format(
+                    buffer.height, buffer.width, height, width))
+            board = buffer.clone()
+            board.tick = tick
+            return board
+
+        stride = (width + 7) // 8
+
+        # NumPy arrays are only recognized by their attributes, so NumPy is
+        # never imported unless one is passed in
+        if hasattr(buffer, 'ndim') and hasattr(buffer, 'dtype'):
+            import numpy
+
+            if buffer.ndim != 2 or buffer.shape[0] != height:
+                raise ValueError('Array shape {} doesn\'t match a {}x{} board.'.format(
+                    buffer.shape, height, width))
+            if buffer.shape[1] == width and not (buffer.dtype == numpy.uint8 and width == stride):
+                buffer = numpy.packbits(buffer.astype(bool), axis=1)
+            elif buffer.shape[1] != stride or buffer.dtype != numpy.uint8:
+                raise ValueError('Array shape {} doesn\'t match a {}x{} board.'.format(
+                    buffer.shape, height, width))
+            buffer = numpy.ascontiguousarray(buffer).tobytes()
+
+        buffer = memoryview(buffer).cast('B')
+        if len(buffer) != height * stride:
+            raise ValueError('Buffer holds {} bytes, a {}x{} board needs {}.'.format(
+                len(buffer), height, width, height * stride))
+
+        # Each row copies its slice of the buffer once
+        state = [BitArray(bytes=buffer[i * stride:(i + 1) * stride], length=width)
+                 for i in range(height)]
+
+        # Rows were sized from the buffer above, no need to check them again
+        return cls(tick, height, width, state, False)
+
+    def to_bytes(self) -> bytes:
+        """Return the state packed into one buffer, in the layout from_buffer() reads."""
+
+        return b''.join(row.tobytes() for row in self.state)
+
+    def clone(self):
+        """Return a copy of this board that shares row storage until either board changes it.
+
+        Cloning only copies the list of rows. Rows are copied by whichever
+        board changes them first, so what-if experiments on a clone use
+        memory in proportion to the rows they touch.
+
+        """
+
+        board = copy.copy(self)
+        board.state = list(self.state)
+        board.clipboard = None
+        board.history = None
+        # Generations seen by a detector belong to this board's run only
+        board.escape_detector = None
+        if self.neighbor_counts is not None:
+            board.neighbor_counts = [bytearray(row) for row in self.neighbor_counts]
+            board.dirty_cells = set(self.dirty_cells)
+
+        # Every row is now shared by both boards
+        self.shared_rows = set(range(self.height))
+        board.shared_rows = set(range(self.height))
+
+        return board
+
+    def writable_row(self, row) -> BitArray:
+        """Return the BitArray of a row, copying it first if it is shared with a clone."""
+
+        if row in self.shared_rows:
+            self.state[row] = BitArray(self.state[row])
+            self.shared_rows.discard(row)
+
+        return self.state[row]
+
+    def set_state(self, state: List[BitArray], shared=False):
+        """Replace the whole state with a list of BitArray rows.
+
+        Arguments:
+            state: List of height BitArrays of width bits.
+            shared: Bool indicating whether the rows are also referenced
+                elsewhere (by a history or another board) and must be
+                copied before being changed.
+
+        """
+
+        self.state = state
+        self.shared_rows = set(range(self.height)) if shared else set()
+
+        if self.neighbor_counts is not None:
+            self.enable_neighbor_counts()
+
+    def __str__(self):
+        """Display relevant metadata for Board objects."""
+
+        s = '<life.Board object at {}>:'.format(hex(id(self)))
+        s += '\n\ttick: {}'.format(self.tick)
+        s += '\n\theight: {}'.format(self.height)
+        s += '\n\twidth: {}'.format(self.width)
+        s += '\n\tstate:'
+        s += '\n\t\t<'
+        for row in self.state:
+            # Print binary representation of BitArray object
+            s += '\n\t\t\t{}'.format(row.bin)
+        s += '\n\t\t>'
+
+        return s
+
+    def set_board_states_from_coords(self, cell_list, cmd, clear=False, start_square=(0, 0)):
+        """Make the cells in cell_list alive or dead, depending on cmd, return success message.
+
+        The cells are gathered into one bit mask per board row and applied with
+        a single blit per row, so large patterns cost a few bulk operations per
+        row instead of one call per cell.
+
+        """
+
+        msg_below = ''
+
+        # Clear the board when using a preset
+        if clear:
+            self.clear_board()
+
+        # Build a mask of the cells to change for every affected row
+        masks = {}
+        for tup in cell_list:
+            col, row = (tup[0] + start_square[0]) % self.width, \
+                       (tup[1] + start_square[1]) % self.height
+            masks[row] = masks.get(row, 0) | 1 << (self.width - 1 - col)
+
+        # Describe each cell only when there are few enough to read
+        if len(cell_list) <= MAX_CELL_MESSAGES:
+            for tup in cell_list:
+                col, row = (tup[0] + start_square[0]) % self.width, \
+                           (tup[1] + start_square[1]) % self.height
+                if cmd == 'live':
+                    if self.is_alive(row, col):
+                        msg_below += '\tCell at ({}, {}) was already ' \
+                                     'alive.\n'.format(col + 1, row + 1)
+                    else:
+                        msg_below += '\tRevived cell at ({}, {}).\n' \
+                                     ''.format(col + 1, row + 1)
+                else:
+                    if self.is_dead(row, col):
+                        msg_below += '\tCell at ({}, {}) was already ' \
+                                     'dead.\n'.format(col + 1, row + 1)
+                    else:
+                        msg_below += '\tKilled cell at ({}, {}).\n' \
+                                     ''.format(col + 1, row + 1)
+
+        # Update the board one row at a time
+        changed = 0
+        for row, mask in masks.items():
+            bits = BitArray(uint=mask, length=self.width)
+            if cmd == 'live':
+                changed += (bits & ~self.state[row]).count(1)
+                self.blit_row(row, 0, bits, 'or')
+            else:
+                changed += (bits & self.state[row]).count(1)
+                self.blit_row(row, 0, bits, 'clear')
+
+        if len(cell_list) > MAX_CELL_MESSAGES:
+            total = sum(bin(mask).count('1') for mask in masks.values())
+            if cmd == 'live':
+                msg_below += '\tRevived {} cells ({} were already alive).\n' \
+                             ''.format(changed, total - changed)
+            else:
+                msg_below += '\tKilled {} cells ({} were already dead).\n' \
+                             ''.format(changed, total - changed)
+
+        return msg_below
+
+    def clear_board(self):
+        """Kill all cell objects in self."""
+
+        self.set_state(self.get_blank_board(self.height, self.width))
+
+    def wrapped_spans(self, col, width):
+        """Yield (start, stop, offset) slices covering width columns from col.
+
+        Spans that run off the right edge wrap to the left edge of the
+        toroidal board; offset is the index of the span's first column
+        within the width columns.
+
+        """
+
+        if width > self.width:
+            raise ValueError('Region is wider than the board.')
+
+        col %= self.width
+        first = min(width, self.width - col)
+        yield col, col + first, 0
+        if first < width:
+            yield 0, width - first, first
+
+    def blit_row(self, row, col, bits, mode='set'):
+        """Combine bits into the board row starting at col, wrapping around the board.
+
+        Arguments:
+            row: Int index of the board row.
+            col: Int column where bits[0] is written.
+            bits: Bits to combine into the row.
+            mode: How bits are combined with the row: 'set' (copy), 'or',
+                'xor', 'and', or 'clear' (kill cells set in bits).
+
+        """
+
+        row %= self.height
+        board_row = self.writable_row(row)
+
+        # Keep a copy to find the cells whose neighbors need new counts
+        if self.neighbor_counts is not None:
+            before = BitArray(board_row)
+
+        for start, stop, offset in self.wrapped_spans(col, len(bits)):
+            piece = bits[offset:offset + stop - start]
+            if mode == 'set':
+                board_row[start:stop] = piece
+            else:
+                segment = board_row[start:stop]
+                if mode == 'or':
+                    segment |= piece
+                elif mode == 'xor':
+                    segment ^= piece
+                elif mode == 'and':
+                    segment &= piece
+                elif mode == 'clear':
+                    segment &= ~piece
+                else:
+                    raise ValueError('Unknown blit mode "{}".'.format(mode))
+                board_row[start:stop] = segment
+
+        if self.neighbor_counts is not None:
+            for changed_col in (before ^ board_row).findall('0b1'):
+                self.adjust_neighbor_counts(row, changed_col, 1 if board_row[changed_col] else -1)
+
+    def fill_region(self, row, col, height, width, alive=True):
+        """Make every cell of a region alive (or dead), wrapping around the board.
+
+        Arguments:
+            row: Int bottom row of the region.
+            col: Int left column of the region.
+            height: Int number of rows in the region.
+            width: Int number of columns in the region.
+            alive: Bool state to give the cells.
+
+        """
+
+        if height > self.height:
+            raise ValueError('Region is taller than the board.')
+
+        bits = BitArray(length=width)
+        if alive:
+            bits.invert()
+
+        for i in range(height):
+            self.blit_row(row + i, col, bits)
+
+    def clear_region(self, row, col, height, width):
+        """Kill every cell of a region, wrapping around the board."""
+
+        self.fill_region(row, col, height, width, False)
+
+    def copy_region(self, row, col, height, width) -> List[BitArray]:
+        """Return a copy of a region of the board as a list of BitArray rows.
+
+        Rows are ordered bottom to top like self.state, and the region wraps
+        around the board.
+
+        """
+
+        if height > self.height:
+            raise ValueError('Region is taller than the board.')
+
+        clip = []
+        for i in range(height):
+            board_row = self.state[(row + i) % self.height]
+            clip_row = BitArray()
+            for start, stop, _ in self.wrapped_spans(col, width):
+                clip_row.append(board_row[start:stop])
+            clip.append(clip_row)
+
+        return clip
+
+    def paste_region(self, clip: List[BitArray], row, col, mode='set'):
+        """Write a clip made by copy_region() into the board with its bottom-left cell at (row, col).
+
+        See blit_row() for the available modes; 'or' stamps the clip's living
+        cells over the board and 'xor' toggles them.
+
+        """
+
+        if len(clip) > self.height:
+            raise ValueError('Region is taller than the board.')
+
+        for i, clip_row in enumerate(clip):
+            self.blit_row(row + i, col, clip_row, mode)
+
+    @staticmethod
+    def rotate_clip(clip: List[BitArray], turns=1) -> List[BitArray]:
+        """Return clip rotated counterclockwise by 90 degrees the given number of times."""
+
+        turns %= 4
+        if turns == 2:
+            return Board.flip_clip(Board.flip_clip(clip, True), False)
+
+        for _ in range(turns):
+            # Columns of the clip read top to bottom become its rows
+            clip = [BitArray(bin=''.join(col)) for col in zip(*(row.bin for row in reversed(clip)))]
+
+        return [BitArray(row) for row in clip]
+
+    @staticmethod
+    def flip_clip(clip: List[BitArray], horizontal=True) -> List[BitArray]:
+        """Return clip mirrored left-to-right (or top-to-bottom if horizontal is false)."""
+
+        if not horizontal:
+            return [BitArray(row) for row in reversed(clip)]
+
+        flipped = []
+        for row in clip:
+            row = BitArray(row)
+            row.reverse()
+            flipped.append(row)
+
+        return flipped
+
+    @staticmethod
+    def get_blank_board(height, width) -> List[BitArray]:
+        """Return a list of BitArrays initialized to 0.
+
+        Arguments:
+            height: Int height of the board to generate
+            width: Int width of the board to generate
+
+        This method is static so a blank board can be
+        generated at instance creation.
+
+        """
+
+        # Create the list
+        return [BitArray(length=width) for _ in range(height)]
+
+    @staticmethod
+    def get_random_board(height, width, density) -> List[BitArray]:
+        """Randomize alive and dead cells in the board.
+
+        Arguments:
+            height: Int height of the board to generate
+            width: Int width of the board to generate
+            density: Percent of cells that should be alive (0 < density <= 100)
+
+        This method is static so boards can be instantiated without
+        looping through board twice (once to instantiate to BitArrays
+        of 0s, again to randomize board).
+
+        Credit for random bit generation strategy:
+            https://stackoverflow.com/questions/14324472/random-boolean-by-percentage
+
+        """
+
+        new_state = []
+
+        for row in range(height):
+            # Create BitArray to hold the row
+            new_state.append(BitArray())
+
+            for col in range(width):
+                # Generate random bit
+                bit = random.uniform(0, 1) < density / 100
+
+                # Add to the BitArray
+                new_state[row].append('0b' + str(int(bit)))
+
+        # Prevent low percentages returning a blank board
+        if new_state == Board.get_blank_board(height, width):
+           return Board.get_random_board(height, width, density)
+
+        return new_state
+
+    def render_cell(self, row, col, dark, end=''):
+        """Print the current state of the cell."""
+
+        # Prints characters twice in a row so they appear as squares in the terminal
+        if self.is_alive(row, col):
+            print(Board.alive_char*2, end=end)
+        elif dark:
+            print(Board.dead_char_dark*2, end=end)
+        else:
+            print(Board.dead_char*2, end=end)
+
+    def render_board(self, msg_side='', msg_below='', show_coords=False, checker=False):
+        """Render the current state of the board.
+
+        Arguments:
+            msg_side: String printed to the right of board at the top row.
+            msg_below: String printed below board (with end='').
+            show_coords: Bool indicating whether board should display
+                coordinates at left and bottom of board.
+            checker: Bool indicating whether board should be rendered
+                with a checkerboard background.
+
+        """
+
+        # Extra left padding if showing coordinates
+        if show_coords:
+            print(' ', end='')
+
+        # Top of the board
+        print('  ' + '┌' + '─' * (self.width*2 + 2) + '┐')
+
+        # Print middle of the board
+        for row in range(self.height-1, -1, -1):
+            # Print row coordinates if applicable
+            if show_coords:
+                if (row+1) % 5 == 0:
+                    print('{} '.format(str(row+1).rjust(2)), end='')
+                else:
+                    print('   ', end='')
+            else:
+                print('  ', end='')
+
+            # Print left edge of the board
+            print('│ ', end='')
+
+            # Print the cell
+            for col in range(self.width):
+                # Creates checkerboard effect if applicable
+                dark = (row + col) % 2 == 1 and checker
+
+                # Print the state of the cell
+                self.render_cell(row, col, dark)
+
+            # Print right edge of the board
+            print(' │', end='')
+
+            # Print message on top row if it exists
+            if row == self.height-1 and msg_side != '':
+                print('    {}'.format(msg_side))
+            else:
+                print()
+
+        # Print extra left padding if showing coordinates
+        if show_coords:
+            print(' ', end='')
+
+        # Print bottom of the board
+        print('  ' + '└' + '─' * (self.width*2 + 2) + '┘')
+
+        # Print column coords if applicable
+        if show_coords:
+            if self.width > 99:
+                # Rewrite this part if this becomes a problem
+                raise ValueError('render_board() cannot currently handle board widths of 3 digits '
+                                 'when printing col coordinates')
+
+            if self.width > 9:
+                # First and second digits of col coords should be printed vertically
+                top_line = ''
+                bottom_line = ''
+                for i in range(5, self.width+1, 5):
+                    top_line += '{0:<10}'.format(str(i).ljust(2)[0])
+                    bottom_line += '{0:<10}'.format(str(i).ljust(2)[1])
+
+                # Print the two lines with leading 0 coordinate
+                print(' 0           ' + top_line)
+                print('              ' + bottom_line)
+            else:
+                # Col numbers can be printed normally (horizontally)
+                top_line = ''
+                for i in range(5, self.width+1, 5):
+                    top_line += '{0:<10}'.format(str(i).ljust(2)[0])
+
+                # Print the line with leading 0 coordinate
+                print(' 0           ' + top_line)
+
+            print()
+        if msg_below != '':
+            print(msg_below, end='')
+
+    def tick_board(self, num_ticks=1, flush=True, delay=0, show_ticks=True, render=True):
+        """Advance the board by given number of game ticks.
+
+        If render is false, only the final board is rendered and the ticks go
+        through advance(), so a result cache can skip the simulation. Rendered
+        runs don't use the cache: most of them are the single ticks of
+        pressing enter, whose results would never be looked up.
+
+        If self.escape_detector finds that only spaceships are still moving,
+        the run either stops there or, with the 'fast-forward' action, skips
+        ahead to where the spaceships could next run into something.
+
+        """
+
+        detector = self.escape_detector
+        if detector is not None and detector.tick != self.tick:
+            # The board changed since the detector last saw it
+            detector.reset()
+
+        if not render:
+            start_tick = self.tick
+            start_skipped = detector.skipped if detector is not None else 0
+            cached = self.advance(num_ticks)
+
+            # Clear terminal if applicable
+            if flush:
+                flush_terminal()
+
+            msg = ''
+            if show_ticks:
+                msg = 'Tick: {}'.format(self.tick)
+            self.render_board('[GAME OF LIFE]  ' + msg)
+
+            if show_ticks:
+                skipped = detector.skipped - start_skipped if detector is not None else 0
+                print('\tAdvanced the board by {} ticks{}.\n'.format(
+                    self.tick - start_tick, ' (from cache)' if cached else
+                    ' ({} fast-forwarded)'.format(skipped) if skipped else ''))
+            else:
+                print()
+
+            if detector is not None and detector.report is not None and \
+                    detector.tick == self.tick:
+                print('{}\n'.format(detector.report))
+
+            return
+
+        # Convert milliseconds to seconds
+        delay /= 1000
+
+        escape = None
+        done = 0
+        while done < num_ticks:
+            # Update board
+            was_escaping = detector is not None and detector.report is not None
+            escape = self.next_tick()
+            done += 1
+
+            # Move spaceships ahead while they can't run into anything
+            skipped = 0
+            if escape is not None and detector.action == 'fast-forward':
+                skipped = detector.fast_forward(self, num_ticks - done)
+                done += skipped
+                if skipped and self.history is not None:
+                    self.history.record(self, 'tick')
+
+            # Clear terminal if applicable
+            if flush:
+                flush_terminal()
+
+            # Render board
+            msg = ''
+            if show_ticks:
+                msg = 'Tick: {}'.format(self.tick)
+            self.render_board('[GAME OF LIFE]  ' + msg)
+
+            if skipped:
+                print('{}\n\tFast-forwarded {} ticks.\n'.format(escape, skipped))
+
+            # Runs started during an escape go on until the next one
+            if escape is not None and detector.action == 'stop' and not was_escaping:
+                break
+
+            # Wait
+            time.sleep(delay)
+
+        if show_ticks:
+            print('\tAdvanced the board by {} ticks.\n'.format(done))
+        else:
+            print()
+
+        if escape is not None and detector.action == 'stop':
+            print('{}\n'.format(escape))
+
+    def next_tick(self):
+        """Advance the board by one tick, counting it and recording it in history.
+
+        Return what self.escape_detector found at the new tick, if any.
+
+        """
+
+        self.step()
+        self.tick += 1
+
+        if self.history is not None:
+            self.history.record(self, 'tick')
+        if self.escape_detector is not None:
+            return self.escape_detector.update(self)
+
+        return None
+
+    def advance(self, num_ticks) -> bool:
+        """Advance the board by given number of game ticks without rendering it.
+
+        When self.result_cache is set, the result is looked up by the current
+        state before simulating and stored after. Return true if it came from
+        the cache.
+
+        When self.escape_detector is set, every tick is checked. With the
+        'stop' action the run stops early once spaceships start being the only
+        thing moving, and such runs bypass the cache; with 'fast-forward' the
+        spaceships are moved ahead whole periods at a time instead of
+        simulating ticks where only they move.
+
+        """
+
+        detector = self.escape_detector
+        stopping = detector is not None and detector.action == 'stop'
+        if detector is not None and detector.tick != self.tick:
+            # The board changed since the detector last saw it
+            detector.reset()
+
+        if self.result_cache is not None and not stopping:
+            key = self.result_cache.key(self.to_bytes(), self.height, self.width, RULE, num_ticks)
+            # A damaged entry is a miss rather than a state from_buffer() rejects
+            state = self.result_cache.get(key, self.height * ((self.width + 7) // 8))
+
+            if state is not None:
+                self.set_state(Board.from_buffer(0, self.height, self.width, state).state)
+                self.tick += num_ticks
+                if self.history is not None:
+                    self.history.record(self, 'tick')
+                return True
+
+        if detector is None:
+            for i in range(num_ticks):
+                self.step()
+            self.tick += num_ticks
+        else:
+            done = 0
+            while done < num_ticks:
+                was_escaping = detector.report is not None
+                self.step()
+                self.tick += 1
+                done += 1
+
+                if detector.update(self) is not None:
+                    if not stopping:
+                        done += detector.fast_forward(self, num_ticks - done)
+                    elif not was_escaping:
+                        # Runs started during an escape go on until the next one
+                        break
+
+        if self.result_cache is not None and not stopping:
+            self.result_cache.put(key, self.to_bytes())
+        if self.history is not None:
+            self.history.record(self, 'tick')
+
+        return False
+
+    def cell_at(self, row, col):
+        """Return state of the cell at given coordinates.
+
+        This is equivalent to is_alive(); included for semantic clarity.
+
+        """
+
+        return self.state[row][col]
+
+    def next_state(self, row, col) -> bool:
+        """Return the correct state of given cell at the next game tick."""
+
+        # Set next state depending on number of living neighbors
+        neighbors = self.num_alive_neighbors(row, col)
+        if self.is_alive(row, col):
+            # Cell is alive
+            if neighbors < 2:
+                # Die by underpopulation
+                should_live = False
+            elif neighbors > 3:
+                # Die by overpopulation
+                should_live = False
+            else:
+                # Stay alive with 2 or 3 neighbors
+                should_live = True
+        else:
+            # Cell is dead
+            if neighbors == 3:
+                # Live by reproduction
+                should_live = True
+            else:
+                # Stay dead
+                should_live = False
+
+        return should_live
+
+    def is_alive(self, row, col):
+        """Return true if cell at given coordinates is true.
+
+        This is equivalent to is_alive(); included for semantic clarity.
+
+        """
+
+        return self.state[row][col]
+
+    def is_dead(self, row, col):
+        """Return true if cell at given coordinates is false."""
+
+        return not self.state[row][col]
+
+    def live(self, row, col):
+        """Make the cell at the given coordinates alive."""
+
+        if self.shared_rows or self.neighbor_counts is not None:
+            if self.state[row][col]:
+                return
+            if row in self.shared_rows:
+                self.writable_row(row)
+            if self.neighbor_counts is not None:
+                self.adjust_neighbor_counts(row, col, 1)
+
+        self.state[row][col] = True
+
+    def die(self, row, col):
+        """Make the cell at the given coordinates dead."""
+
+        if self.shared_rows or self.neighbor_counts is not None:
+            if not self.state[row][col]:
+                return
+            if row in self.shared_rows:
+                self.writable_row(row)
+            if self.neighbor_counts is not None:
+                self.adjust_neighbor_counts(row, col, -1)
+
+        self.state[row][col] = False
+
+    def step(self):
+        """Advance the board by one game tick.
+
+        Uses the neighbor counts if they are enabled, else the engine named by
+        self.engine.
+
+        """
+
+        if self.neighbor_counts is not None:
+            self.advance_incremental()
+
+            if self.check_counts:
+                mismatches = self.check_neighbor_counts()
+                if mismatches:
+                    row, col, stored, actual = mismatches[0]
+                    raise RuntimeError('Neighbor count of cell ({}, {}) is {}, recount gives {} '
+                                       '({} mismatches).'.format(row, col, stored, actual,
+                                                                  len(mismatches)))
+        else:
+            engines.ENGINES[self.engine](self)
+
+    def enable_neighbor_counts(self):
+        """Start keeping a count of living neighbors for every cell.
+
+        Once enabled, live() and die() add to or subtract from the counts of
+        the 8 neighbors of every cell they change, and step() only evaluates
+        cells whose state or count changed since the previous generation.
+
+        """
+
+        counts = [bytearray(self.width) for _ in range(self.height)]
+        self.neighbor_counts = counts
+        self.dirty_cells = set()
+
+        # Only living cells contribute, so visit those instead of every cell
+        for row in range(self.height):
+            for col in self.state[row].findall('0b1'):
+                self.adjust_neighbor_counts(row, col, 1)
+
+        # Every cell must be evaluated in the first generation
+        self.dirty_cells = {(row, col) for row in range(self.height) for col in range(self.width)}
+
+    def disable_neighbor_counts(self):
+        """Stop keeping neighbor counts."""
+
+        self.neighbor_counts = None
+        self.dirty_cells = None
+
+    def adjust_neighbor_counts(self, row, col, delta):
+        """Add delta to the neighbor counts around a cell that changed state."""
+
+        counts = self.neighbor_counts
+        dirty = self.dirty_cells
+
+        dirty.add((row, col))
+        for try_row in [-1, +0, +1]:
+            count_row = counts[(row + try_row) % self.height]
+            for try_col in [-1, +0, +1]:
+                # Skip the cell itself, (+0, +0)
+                if not try_row == try_col == 0:
+                    # Wrap the same way num_alive_neighbors() does
+                    neighbor = (row + try_row) % self.height, (col + try_col) % self.width
+                    count_row[neighbor[1]] += delta
+                    dirty.add(neighbor)
+
+    def check_neighbor_counts(self) -> list:
+        """Return (row, col, stored count, recounted count) of every cell whose count is wrong."""
+
+        mismatches = []
+        for row in range(self.height):
+            for col in range(self.width):
+                actual = self.num_alive_neighbors(row, col)
+                if self.neighbor_counts[row][col] != actual:
+                    mismatches.append((row, col, self.neighbor_counts[row][col], actual))
+
+        return mismatches
+
+    def advance_incremental(self):
+        """Advance the board by one game tick using the neighbor counts.
+
+        A cell whose state and neighbor count are both unchanged since the last
+        generation keeps its state, so only cells in dirty_cells are evaluated.
+
+        """
+
+        # Evaluate every candidate before changing any cell, as in advance_all()
+        candidates = self.dirty_cells
+        self.dirty_cells = set()
+
+        should_live = []
+        should_die = []
+        for row, col in candidates:
+            neighbors = self.neighbor_counts[row][col]
+            if self.state[row][col]:
+                if neighbors < 2 or neighbors > 3:
+                    should_die.append((row, col))
+            elif neighbors == 3:
+                should_live.append((row, col))
+
+        # Changing the cells updates the counts and marks the next candidates
+        for coord in should_live:
+            self.live(coord[0], coord[1])
+
+        for coord in should_die:
+            self.die(coord[0], coord[1])
+
+    def advance_all(self):
+        """Advance every cell on the board by one game tick."""
+
+        # Create lists of cells to change after all cells are evaluated
+        # If cells were changed immediately, number of neighbors would be
+        # measured inaccurately
+        should_live = []
+        should_die = []
+
+        # Update states in the new board where applicable
+        for row in range(self.height):
+            for col in range(self.width):
+                # Update the state of the cell at these coordinates
+                if self.next_state(row, col):
+                    should_live.append((row, col))
+                else:
+                    should_die.append((row, col))
+
+        # Update the cells
+        for coord in should_live:
+            self.live(coord[0], coord[1])
+
+        for coord in should_die:
+            self.die(coord[0], coord[1])
+
+    def num_alive_neighbors(self, row, col) -> int:
+        """Return number of alive cells adjacent to cell on given board at given coordinates."""
+
+        # Assumes state has width and length
+        state_height = len(self.state)
+        state_width = len(self.state[0])
+
+        # Sum the neighboring cells, top-to-bottom and left-to-right
+        num_neighbors = 0
+        for try_row in [-1, +0, +1]:
+            for try_col in [-1, +0, +1]:
+                # Skip the cell itself, (+0, +0)
+                if not try_row == try_col == 0:
+                    # Add the neighboring cell to the total (False is 0, True is 1).
+                    # The modulo creates a toroidal wrapping effect.
+                    num_neighbors += self.cell_at(
+                        (row + try_row) % state_height,
+                        (col + try_col) % state_width
+                    )
+
+        return num_neighbors
+
+    def row_in_range(self, row) -> bool:
+        """Return true if row is in range of the board height."""
+
+        return 0 <= row < self.height
+
+    def col_in_range(self, col) -> bool:
+        """Return true if col is in range of the board width."""
+
+        return 0 <= col < self.width
+
+    def coord_in_range(self, coord: tuple) -> bool:
+        """Return true if items in given (col, row) coordinate contains valid indices of the board.
+
+        Credit to Patrick Artner:
+            https://stackoverflow.com/questions/53419606/validating-user-input-with-regex
+
+        """
+
+        return all(isinstance(num, int) for num in coord) \
+            and self.col_in_range(coord[0]) \
+            and self.row_in_range(coord[1])
+
+
+def flush_terminal():
+    """Clear output on the terminal."""
+
+    os.system('cls||clear')
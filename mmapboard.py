@@ -0,0 +1,257 @@
+import os
+import mmap
+import time
+import random
+import struct
+import argparse
+from bitstring import BitArray
+
+from engines import next_row_value
+
+
+# Magic bytes, height, width and tick at the start of every board file
+HEADER = struct.Struct('<8sQQQ')
+HEADER_SIZE = 64
+MAGIC = b'LIFEMAP1'
+
+# Names of the two board files inside a MappedBoard's directory
+BUFFER_FILES = ('a.life', 'b.life')
+
+
+class MappedBoard:
+    """Toroidal board stored in memory-mapped files instead of Python objects.
+
+    The packed rows (ceil(width / 8) bytes each, bottom row first, most
+    significant bit first, the same layout as Board.to_bytes()) live in one of
+    two files in a directory. A tick reads the current file a stripe of rows at
+    a time, plus one halo row above and below, and writes the next generation
+    to the other file, whose header tick is written last. The file with the
+    highest tick is the current one, so an interrupted tick leaves the last
+    complete generation in place.
+
+    Only a stripe and its halos are held as Python ints at once, so board size
+    is bounded by disk space rather than RAM: a 100,000 x 100,000 board takes
+    two files of 1.25 GB.
+
+    """
+
+    def __init__(self, directory, height=None, width=None, stripe_rows=256):
+        """Open the board in directory, creating a blank one if height and width are given.
+
+        Arguments:
+            directory: Path of the directory holding the board files.
+            height: Int height of a new board, or None to open an existing one.
+            width: Int width of a new board, or None to open an existing one.
+            stripe_rows: Int number of rows computed per read/write.
+
+        """
+
+        self.directory = directory
+        self.stripe_rows = stripe_rows
+        paths = [os.path.join(directory, name) for name in BUFFER_FILES]
+
+        if height is not None and width is not None:
+            os.makedirs(directory, exist_ok=True)
+            self.height = height
+            self.width = width
+            for path in paths:
+                with open(path, 'wb') as f:
+                    # Truncating makes a sparse file of dead cells
+                    f.truncate(HEADER_SIZE + height * self.stride)
+                    f.write(HEADER.pack(MAGIC, height, width, 0))
+        elif not all(os.path.exists(path) for path in paths):
+            raise FileNotFoundError('No board files in {}.'.format(directory))
+
+        self._files = [open(path, 'r+b') for path in paths]
+        self._maps = [mmap.mmap(f.fileno(), 0) for f in self._files]
+        for m in self._maps:
+            # Stripes are read front to back, let the OS read ahead
+            if hasattr(m, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                m.madvise(mmap.MADV_SEQUENTIAL)
+
+        headers = [HEADER.unpack_from(m) for m in self._maps]
+        for magic, height, width, _ in headers:
+            if magic != MAGIC:
+                raise ValueError('{} doesn\'t hold a board.'.format(directory))
+        self.height, self.width = headers[0][1], headers[0][2]
+
+        # The first file wins ties, as in a new board
+        ticks = [tick for _, _, _, tick in headers]
+        self.current = 0 if ticks[0] >= ticks[1] else 1
+        self.tick = ticks[self.current]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def stride(self) -> int:
+        """Return the number of bytes per row."""
+
+        return (self.width + 7) // 8
+
+    def close(self):
+        """Flush and close the board files."""
+
+        for m in self._maps:
+            m.flush()
+            m.close()
+        for f in self._files:
+            f.close()
+
+    def _read_rows(self, m, start, count) -> list:
+        """Return count rows of map m as ints, starting at row start and wrapping."""
+
+        pad = self.stride * 8 - self.width
+        values = []
+        while count > 0:
+            start %= self.height
+            n = min(count, self.height - start)
+            offset = HEADER_SIZE + start * self.stride
+            data = m[offset:offset + n * self.stride]
+            for i in range(n):
+                values.append(int.from_bytes(data[i * self.stride:(i + 1) * self.stride],
+                                             'big') >> pad)
+            start += n
+            count -= n
+
+        return values
+
+    def _write_rows(self, m, start, values):
+        """Write consecutive rows (as ints) to map m from row start."""
+
+        pad = self.stride * 8 - self.width
+        offset = HEADER_SIZE + start * self.stride
+        m[offset:offset + len(values) * self.stride] = \
+            b''.join((value << pad).to_bytes(self.stride, 'big') for value in values)
+
+    def get_row(self, row) -> BitArray:
+        """Return a copy of a row of the current generation."""
+
+        return BitArray(uint=self._read_rows(self._maps[self.current], row, 1)[0],
+                        length=self.width)
+
+    def set_row(self, row, bits):
+        """Overwrite a row of the current generation with width bits."""
+
+        if len(bits) != self.width:
+            raise ValueError('Row must be {} bits long.'.format(self.width))
+
+        self._write_rows(self._maps[self.current], row, [BitArray(bits).uint])
+
+    def randomize(self, density, seed=None):
+        """Fill the current generation with random cells.
+
+        Each cell is alive with probability density (percent), rounded to a
+        multiple of 1/256: a row is built from 8 random rows by OR-ing in a
+        random row for every set bit of the probability and AND-ing one for
+        every clear bit, least significant bit first.
+
+        """
+
+        rng = random.Random(seed)
+        level = max(0, min(256, round(density / 100 * 256)))
+        m = self._maps[self.current]
+
+        for start in range(0, self.height, self.stripe_rows):
+            values = []
+            for _ in range(min(self.stripe_rows, self.height - start)):
+                if level == 256:
+                    values.append((1 << self.width) - 1)
+                    continue
+                value = 0
+                for bit in range(8):
+                    if level >> bit & 1:
+                        value |= rng.getrandbits(self.width)
+                    else:
+                        value &= rng.getrandbits(self.width)
+                values.append(value)
+            self._write_rows(m, start, values)
+
+    def population(self) -> int:
+        """Return the number of living cells, reading the board a stripe at a time."""
+
+        total = 0
+        m = self._maps[self.current]
+        for start in range(0, self.height, self.stripe_rows):
+            count = min(self.stripe_rows, self.height - start)
+            total += sum(bin(value).count('1') for value in self._read_rows(m, start, count))
+
+        return total
+
+    def step(self):
+        """Advance the board by one tick into the other file, then make it current."""
+
+        source = self._maps[self.current]
+        target = self._maps[1 - self.current]
+
+        for start in range(0, self.height, self.stripe_rows):
+            count = min(self.stripe_rows, self.height - start)
+
+            # The stripe plus one halo row on each side
+            values = self._read_rows(source, start - 1, count + 2)
+            self._write_rows(target, start, [
+                next_row_value(values[i - 1], values[i], values[i + 1], self.width)
+                for i in range(1, count + 1)])
+
+        # Publish the new generation only once it is complete
+        target.flush()
+        HEADER.pack_into(target, 0, MAGIC, self.height, self.width, self.tick + 1)
+        target.flush(0, min(mmap.PAGESIZE, len(target)))
+
+        self.current = 1 - self.current
+        self.tick += 1
+
+    @classmethod
+    def from_board(cls, board, directory, stripe_rows=256):
+        """Return a MappedBoard in directory holding a copy of a Board's state."""
+
+        mapped = cls(directory, board.height, board.width, stripe_rows)
+        mapped._write_rows(mapped._maps[mapped.current], 0, [row.uint for row in board.state])
+        HEADER.pack_into(mapped._maps[mapped.current], 0, MAGIC, board.height, board.width,
+                         board.tick)
+        mapped.tick = board.tick
+
+        return mapped
+
+    def to_board(self):
+        """Return a Board holding the current generation (only for boards that fit in memory)."""
+
+        from life import Board
+
+        m = self._maps[self.current]
+        return Board.from_buffer(self.tick, self.height, self.width,
+                                 m[HEADER_SIZE:HEADER_SIZE + self.height * self.stride])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a board stored in memory-mapped files.')
+    parser.add_argument('directory', help='directory holding the board files')
+    parser.add_argument('--size', type=int, nargs=2, metavar=('HEIGHT', 'WIDTH'),
+                        help='create a new board of this size (erases any board in directory)')
+    parser.add_argument('--density', type=float, default=35,
+                        help='percent of living cells in a new board (default 35)')
+    parser.add_argument('--seed', type=int, help='random seed for a new board')
+    parser.add_argument('--ticks', type=int, default=1, help='ticks to run (default 1)')
+    parser.add_argument('--stripe-rows', type=int, default=256,
+                        help='rows computed per read/write (default 256)')
+    args = parser.parse_args()
+
+    if args.size:
+        board = MappedBoard(args.directory, args.size[0], args.size[1], args.stripe_rows)
+        board.randomize(args.density, args.seed)
+    else:
+        board = MappedBoard(args.directory, stripe_rows=args.stripe_rows)
+
+    with board:
+        print('{}x{} board at tick {}.'.format(board.height, board.width, board.tick))
+        for _ in range(args.ticks):
+            start = time.perf_counter()
+            board.step()
+            print('\tTick {} took {:.2f} s.'.format(board.tick, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,442 @@
+import os
+import re
+import json
+from collections import OrderedDict
+from typing import List, Tuple
+
+
+# Directory scanned for pattern files when no other directory is given
+DEFAULT_PATTERN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'patterns')
+
+# Extensions of the pattern formats the library can read
+PATTERN_EXTENSIONS = ('.rle', '.cells')
+
+# Bump when the layout of index entries changes so stale indexes get rebuilt
+INDEX_VERSION = 1
+
+
+class PatternEntry:
+    """Metadata for one pattern file, as stored in the library index."""
+
+    def __init__(self, path, name, width, height, population, period=None,
+                 displacement=None, tags=()):
+        """Initialize PatternEntry object."""
+
+        self.path = path
+        self.name = name
+        self.width = width
+        self.height = height
+        self.population = population
+        self.period = period
+        self.displacement = displacement
+        self.tags = tuple(tags)
+
+    def __repr__(self):
+        return '<PatternEntry {!r} {}x{}>'.format(self.name, self.width, self.height)
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable dict of this entry."""
+
+        return {'path': self.path,
+                'name': self.name,
+                'width': self.width,
+                'height': self.height,
+                'population': self.population,
+                'period': self.period,
+                'displacement': self.displacement,
+                'tags': list(self.tags)}
+
+    @classmethod
+    def from_dict(cls, d: dict):
+        """Return a PatternEntry built from a dict made by to_dict()."""
+
+        return cls(d['path'], d['name'], d['width'], d['height'], d['population'],
+                   d['period'], d['displacement'], d['tags'])
+
+
+class PatternLibrary:
+    """Index of a directory of pattern files with lazily loaded pattern bodies.
+
+    The index (name, bounding box, population, period and tags of every
+    pattern) is persisted to index.json inside the pattern directory and is
+    only refreshed for files whose size or modification time changed. Cell
+    lists are parsed on demand and kept in a bounded LRU cache.
+
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory=DEFAULT_PATTERN_DIR, cache_size=128):
+        """Initialize PatternLibrary object.
+
+        Arguments:
+            directory: Path of the directory to scan (recursively) for pattern files.
+            cache_size: Max number of pattern bodies to keep in memory.
+
+        """
+
+        self.directory = directory
+        self.cache_size = cache_size
+        self._entries = None
+        self._by_name = {}
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name.lower() in self._index()
+
+    @property
+    def entries(self) -> List[PatternEntry]:
+        """Return all index entries, sorted by name."""
+
+        if self._entries is None:
+            self.refresh()
+
+        return self._entries
+
+    def _index(self) -> dict:
+        """Return the lowercase-name -> PatternEntry mapping, building it if needed."""
+
+        if self._entries is None:
+            self.refresh()
+
+        return self._by_name
+
+    def refresh(self):
+        """Rescan the pattern directory and update the persisted index."""
+
+        index_path = os.path.join(self.directory, self.INDEX_FILE)
+
+        # Load the previous index so unchanged files don't have to be parsed again
+        old = {}
+        try:
+            with open(index_path) as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                old = data['files']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        files = {}
+        changed = False
+        for path in self._scan():
+            rel = os.path.relpath(path, self.directory)
+            st = os.stat(path)
+
+            prev = old.get(rel)
+            if prev is not None and prev['mtime'] == st.st_mtime and prev['size'] == st.st_size:
+                files[rel] = prev
+                continue
+
+            # New or modified file, parse it
+            try:
+                entry = index_pattern_file(path, rel)
+            except ValueError:
+                # Skip files that aren't valid patterns
+                continue
+
+            files[rel] = {'mtime': st.st_mtime, 'size': st.st_size, 'entry': entry.to_dict()}
+            changed = True
+
+        if changed or set(files) != set(old):
+            try:
+                with open(index_path, 'w') as f:
+                    json.dump({'version': INDEX_VERSION, 'files': files}, f)
+            except OSError:
+                # Read-only pattern directory, keep the index in memory only
+                pass
+
+        self._entries = sorted((PatternEntry.from_dict(v['entry']) for v in files.values()),
+                               key=lambda e: e.name.lower())
+        self._by_name = {}
+        for entry in self._entries:
+            # First file wins if two files share a name
+            self._by_name.setdefault(entry.name.lower(), entry)
+        self._cache.clear()
+
+    def _scan(self):
+        """Yield paths of all pattern files under self.directory."""
+
+        for root, dirs, names in os.walk(self.directory):
+            dirs.sort()
+            for name in sorted(names):
+                if name.lower().endswith(PATTERN_EXTENSIONS):
+                    yield os.path.join(root, name)
+
+    def get(self, name) -> PatternEntry:
+        """Return the entry with the given (case-insensitive) name, or None."""
+
+        return self._index().get(name.lower())
+
+    def cells(self, name) -> Tuple[Tuple[int, int], ...]:
+        """Return the cells of the named pattern, loading the file if not cached.
+
+        Cells are 1-indexed (x, y) tuples with y increasing upwards, the same
+        convention Board.set_board_states_from_coords() expects.
+
+        """
+
+        entry = self.get(name)
+        if entry is None:
+            raise KeyError(name)
+
+        if entry.path in self._cache:
+            self._cache.move_to_end(entry.path)
+            return self._cache[entry.path]
+
+        cells = to_board_coords(read_pattern_file(os.path.join(self.directory, entry.path))[1])
+
+        self._cache[entry.path] = cells
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return cells
+
+    def search(self, query='', max_width=None, max_height=None, limit=None) -> List[PatternEntry]:
+        """Return entries matching every word of query.
+
+        Arguments:
+            query: Words matched against names and tags. A word like "20x10"
+                instead restricts results to patterns at most 20 wide and 10 high.
+            max_width: Int max pattern width, or None for no limit.
+            max_height: Int max pattern height, or None for no limit.
+            limit: Max number of results, or None for all of them.
+
+        """
+
+        words = []
+        for word in query.lower().split():
+            size = re.match(r'^(\d+)x(\d+)$', word)
+            if size:
+                w, h = int(size.group(1)), int(size.group(2))
+                max_width = w if max_width is None else min(max_width, w)
+                max_height = h if max_height is None else min(max_height, h)
+            else:
+                words.append(word)
+
+        results = []
+        for entry in self.entries:
+            if max_width is not None and entry.width > max_width:
+                continue
+            if max_height is not None and entry.height > max_height:
+                continue
+
+            haystack = entry.name.lower() + ' ' + ' '.join(entry.tags)
+            if all(word in haystack for word in words):
+                results.append(entry)
+                if limit is not None and len(results) >= limit:
+                    break
+
+        return results
+
+
+def read_pattern_file(path) -> (dict, List[Tuple[int, int]]):
+    """Return (metadata, cells) of a .rle or .cells file.
+
+    Cells are 0-indexed (col, row) tuples with row 0 at the top, as they
+    appear in the file. Metadata holds 'name' and 'comments'.
+
+    """
+
+    with open(path) as f:
+        text = f.read()
+
+    if path.lower().endswith('.cells'):
+        meta, cells = parse_plaintext(text)
+    else:
+        meta, cells = parse_rle(text)
+
+    if meta.get('name') is None:
+        meta['name'] = os.path.splitext(os.path.basename(path))[0]
+
+    return meta, cells
+
+
+def parse_rle(text) -> (dict, List[Tuple[int, int]]):
+    """Parse a pattern in run length encoded format.
+
+    Format reference:
+        https://conwaylife.com/wiki/Run_Length_Encoded
+
+    """
+
+    meta = {'name': None, 'comments': []}
+    body = []
+    seen_header = False
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith('#'):
+            if line[1:2] == 'N':
+                meta['name'] = line[2:].strip()
+            elif line[1:2] in ('C', 'c'):
+                meta['comments'].append(line[2:].strip())
+        elif not seen_header and line.startswith('x'):
+            # Header line like "x = 3, y = 3, rule = B3/S23"; the bounding
+            # box is recomputed from the cells so only the rule matters
+            seen_header = True
+            rule = re.search(r'rule\s*=\s*(\S+)', line)
+            if rule:
+                meta['rule'] = rule.group(1)
+        elif line:
+            body.append(line)
+            if '!' in line:
+                break
+
+    if not seen_header:
+        raise ValueError('Missing RLE header line.')
+
+    cells = []
+    col = row = 0
+    for count, tag in re.findall(r'(\d*)([a-zA-Z.$!])', ''.join(body)):
+        count = int(count) if count else 1
+        if tag == '!':
+            break
+        elif tag == '$':
+            row += count
+            col = 0
+        elif tag in 'b.':
+            col += count
+        else:
+            # Any other state letter counts as alive
+            cells.extend((col + i, row) for i in range(count))
+            col += count
+
+    return meta, cells
+
+
+def parse_plaintext(text) -> (dict, List[Tuple[int, int]]):
+    """Parse a pattern in plaintext (.cells) format.
+
+    Format reference:
+        https://conwaylife.com/wiki/Plaintext
+
+    """
+
+    meta = {'name': None, 'comments': []}
+    cells = []
+    row = 0
+
+    for line in text.splitlines():
+        if line.startswith('!'):
+            if line.startswith('!Name:'):
+                meta['name'] = line[len('!Name:'):].strip()
+            else:
+                meta['comments'].append(line[1:].strip())
+            continue
+
+        for col, char in enumerate(line.rstrip()):
+            if char in 'O*':
+                cells.append((col, row))
+            elif char != '.':
+                raise ValueError('Unexpected character {!r} in plaintext pattern.'.format(char))
+        row += 1
+
+    return meta, cells
+
+
+def normalize(cells) -> (Tuple[Tuple[int, int], ...], Tuple[int, int]):
+    """Return (cells translated to touch (0, 0), offset that was removed)."""
+
+    if not cells:
+        return (), (0, 0)
+
+    min_x = min(x for x, _ in cells)
+    min_y = min(y for _, y in cells)
+
+    return tuple(sorted((x - min_x, y - min_y) for x, y in cells)), (min_x, min_y)
+
+
+def to_board_coords(cells) -> Tuple[Tuple[int, int], ...]:
+    """Convert file cells (0-indexed, row 0 at top) to 1-indexed (x, y) with y up."""
+
+    cells, _ = normalize(cells)
+    if not cells:
+        return ()
+
+    height = max(y for _, y in cells) + 1
+
+    return tuple((x + 1, height - y) for x, y in cells)
+
+
+def step_cells(cells) -> set:
+    """Return the next generation of a set of (x, y) cells on an unbounded plane."""
+
+    counts = {}
+    for x, y in cells:
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx or dy:
+                    counts[(x + dx, y + dy)] = counts.get((x + dx, y + dy), 0) + 1
+
+    return {cell for cell, n in counts.items() if n == 3 or (n == 2 and cell in cells)}
+
+
+def find_period(cells, max_period=60, max_population=2000):
+    """Return (period, (dx, dy)) of a pattern, or (None, None) if not found.
+
+    The pattern is run on an unbounded plane for up to max_period generations
+    and compared to its first generation up to translation, so spaceships are
+    found along with still lifes and oscillators.
+
+    """
+
+    start, start_offset = normalize(cells)
+    if not start or len(start) > max_population:
+        return None, None
+
+    current = set(cells)
+    for gen in range(1, max_period + 1):
+        current = step_cells(current)
+        if not current or len(current) > max_population:
+            return None, None
+
+        shape, offset = normalize(current)
+        if shape == start:
+            return gen, (offset[0] - start_offset[0], offset[1] - start_offset[1])
+
+    return None, None
+
+
+def index_pattern_file(path, rel_path) -> PatternEntry:
+    """Parse a pattern file and return its index entry."""
+
+    meta, cells = read_pattern_file(path)
+    if not cells:
+        raise ValueError('Pattern has no living cells.')
+
+    xs = [x for x, _ in cells]
+    ys = [y for _, y in cells]
+    period, displacement = find_period(cells)
+
+    # Tags come from the behaviour found above plus any "tags:" comment lines
+    tags = []
+    if period == 1:
+        tags.append('still life')
+    elif period is not None and displacement != (0, 0):
+        tags.append('spaceship')
+    elif period is not None:
+        tags.append('oscillator')
+    for comment in meta['comments']:
+        if comment.lower().startswith('tags:'):
+            tags.extend(t.strip().lower() for t in comment[5:].split(',') if t.strip())
+
+    return PatternEntry(rel_path, meta['name'], max(xs) - min(xs) + 1, max(ys) - min(ys) + 1,
+                        len(set(cells)), period,
+                        list(displacement) if displacement is not None else None, tags)
+
+
+_default_library = None
+
+
+def default_library() -> PatternLibrary:
+    """Return the shared PatternLibrary for DEFAULT_PATTERN_DIR, creating it on first use."""
+
+    global _default_library
+
+    if _default_library is None:
+        _default_library = PatternLibrary()
+
+    return _default_library
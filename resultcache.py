@@ -0,0 +1,164 @@
+import os
+import hashlib
+
+from engines import CACHE_DIR
+
+
+# Extension of the files holding cached states
+RESULT_EXTENSION = '.state'
+
+
+class ResultCache:
+    """On-disk cache mapping (state, rule, number of ticks) to the resulting state.
+
+    Entries are content addressed: the key is a SHA-256 of the rule, the board
+    size and the packed state (Board.to_bytes()), plus the number of ticks, so
+    the same seed placed the same way hits the same entry no matter how the
+    board was built. Each entry is one file holding the packed result, spread
+    over 256 subdirectories by the first byte of the hash.
+
+    Hits update the file's modification time, and the least recently used
+    entries are deleted once the files take more than max_bytes.
+
+    """
+
+    def __init__(self, directory=os.path.join(CACHE_DIR, 'results'), max_bytes=256 * 2**20):
+        """Initialize ResultCache object.
+
+        Arguments:
+            directory: Path of the directory holding the entries.
+            max_bytes: Int cap on the total size of the entries.
+
+        """
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        # Total size of the entries, computed on first put()
+        self._nbytes = None
+
+    @staticmethod
+    def key(state: bytes, height, width, rule, ticks) -> str:
+        """Return the cache key of running a packed state for a number of ticks."""
+
+        digest = hashlib.sha256('{} {}x{}\n'.format(rule, height, width).encode())
+        digest.update(state)
+
+        return '{}-{}'.format(digest.hexdigest(), ticks)
+
+    def _path(self, key) -> str:
+        """Return the path of the file holding key."""
+
+        return os.path.join(self.directory, key[:2], key + RESULT_EXTENSION)
+
+    def get(self, key, size=None) -> bytes:
+        """Return the packed state stored under key, or None.
+
+        Arguments:
+            key: Str key from key().
+            size: Int number of bytes the state must have, or None. An entry
+                of another size, e.g. one truncated by a full disk, is deleted
+                and counts as a miss.
+
+        """
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                state = f.read()
+
+            if size is not None and len(state) != size:
+                os.remove(path)
+                if self._nbytes is not None:
+                    self._nbytes -= len(state)
+                self.misses += 1
+                return None
+
+            # Mark as recently used
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return state
+
+    def put(self, key, state: bytes):
+        """Store a packed state under key, evicting old entries if the cache is full."""
+
+        if len(state) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so readers never see half a state
+            with open(path + '.tmp', 'wb') as f:
+                f.write(state)
+            os.replace(path + '.tmp', path)
+        except OSError:
+            # Unwritable cache, run without it
+            return
+
+        if self._nbytes is None:
+            self._nbytes = sum(size for _, size, _ in self._entries())
+        else:
+            self._nbytes += len(state)
+
+        if self._nbytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """Yield (path, size, mtime) of every entry."""
+
+        try:
+            subdirs = os.listdir(self.directory)
+        except OSError:
+            return
+
+        for subdir in subdirs:
+            subdir = os.path.join(self.directory, subdir)
+            if not os.path.isdir(subdir):
+                continue
+            for name in os.listdir(subdir):
+                if name.endswith(RESULT_EXTENSION):
+                    path = os.path.join(subdir, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, st.st_size, st.st_mtime
+
+    def evict(self):
+        """Delete least recently used entries until the cache is at most 3/4 full.
+
+        Evicting below the cap means a full cache isn't rescanned on every put().
+
+        """
+
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, _ in entries:
+            if total <= self.max_bytes * 3 // 4:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+        self._nbytes = total
+
+    def clear(self):
+        """Delete every entry."""
+
+        for path, _, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        self._nbytes = 0